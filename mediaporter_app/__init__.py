@@ -5,6 +5,9 @@ __all__ = [
     "downloader",
     "gui",
     "models",
+    "settings_cache",
+    "table_models",
+    "throttle",
     "url_parser",
     "worker",
 ]
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import os
 import shutil
 import re
+import threading
+import time
+import heapq
 import json
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Callable
 
@@ -20,11 +27,141 @@ from .models import (
 
 Logger = Callable[[str], None]
 ProgressCallback = Callable[[ProgressUpdate], None]
+BatchProgressCallback = Callable[[int, ProgressUpdate], None]
 BILIBILI_NAV_API = "https://api.bilibili.com/x/web-interface/nav"
 DEFAULT_UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
 )
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*m", re.ASCII)
+INVALID_FILENAME_CHARS = frozenset('\\/:*?"<>|')
+INVALID_FILENAME_PATTERN = re.compile(r"[\\/:*?\"<>|]+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+PROGRESS_MIN_INTERVAL_SECONDS = 0.05
+PROGRESS_REFRESH_INTERVAL_SECONDS = 0.25
+PROBE_INFO_CACHE_SIZE = 32
+# Well inside the lifetime of Bilibili's signed stream URLs.
+PROBE_INFO_TTL_SECONDS = 300
+# Containers yt-dlp/FFmpeg usually leave behind per mode; checked one stat() each before scanning the folder.
+AUDIO_OUTPUT_EXTENSIONS = (".mp3", ".m4a", ".opus", ".aac", ".flac", ".wav", ".ogg", ".webm")
+VIDEO_OUTPUT_EXTENSIONS = (".mp4", ".mkv", ".webm", ".flv", ".mov")
+# HLS/DASH fragments fetched in parallel per download.
+DEFAULT_CONCURRENT_FRAGMENTS = 4
+# Ranged requests keep single-connection servers from throttling one long response.
+HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def detect_ffmpeg() -> bool:
+    # Every task builds its own downloader; walk PATH once and let callers
+    # that know the environment changed (e.g. after an install) cache_clear().
+    return bool(shutil.which("ffmpeg") and shutil.which("ffprobe"))
+
+
+def _strip_ansi(text: str) -> str:
+    # Most errors carry no color codes; the substring check avoids the regex scan entirely.
+    return ANSI_ESCAPE_PATTERN.sub("", text) if "\x1b" in text else text
+
+
+# (rule, lowercase markers, message) in priority order; "format_unavailable" is
+# worded in _map_download_error because it depends on mode and FFmpeg.
+DOWNLOAD_ERROR_RULES: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("drm", ("drm",), "Download failed: DRM-protected content cannot be downloaded by yt-dlp."),
+    (
+        "ffmpeg_missing",
+        ("ffmpeg is not installed",),
+        "Download failed: ffmpeg is missing. Install ffmpeg for high-quality merged video, "
+        "or keep current setup and the app will fallback to single-stream video.",
+    ),
+    (
+        "socket_denied",
+        ("winerror 10013", "access permissions"),
+        "Download failed: Local network/socket permission denied (WinError 10013). "
+        "Please check firewall/proxy/security software.",
+    ),
+    (
+        "forbidden",
+        ("http error 403", "forbidden"),
+        "Download failed: Access denied (403). Login/VIP permission may be required.",
+    ),
+    (
+        "risk_control",
+        ("http error 412",),
+        "Download failed: Request blocked by platform risk control. Retry later or use valid login cookies.",
+    ),
+    (
+        "extractor_broken",
+        ("unable to extract",),
+        "Download failed: The page format may have changed. Try updating yt-dlp.",
+    ),
+    (
+        "paid",
+        ("vip", "pay", "premium"),
+        "Download failed: This content likely requires VIP/payment access with a valid logged-in account.",
+    ),
+    (
+        "login",
+        ("cookie", "login"),
+        "Download failed: Login may be required. Configure browser/file cookies and retry.",
+    ),
+    (
+        "cookie_decrypt",
+        ("decrypt", "dpapi", "keyring"),
+        "Download failed: Browser cookies could not be decrypted/read (DPAPI). "
+        "Try updating yt-dlp and run app under your normal user session.",
+    ),
+    (
+        "cookie_locked",
+        ("could not copy chrome cookie database", "permission denied"),
+        "Download failed: Browser cookie database is locked or inaccessible. "
+        "Close browser completely and retry.",
+    ),
+    (
+        "region",
+        ("geo", "region"),
+        "Download failed: Region-locked content is not available in your current area.",
+    ),
+    ("format_unavailable", ("requested format is not available",), ""),
+)
+DOWNLOAD_ERROR_PRIORITY = {rule: index for index, (rule, _, _) in enumerate(DOWNLOAD_ERROR_RULES)}
+DOWNLOAD_ERROR_MESSAGES = {rule: message for rule, _, message in DOWNLOAD_ERROR_RULES}
+# One alternation wrapped in a lookahead: matches are zero-width, so finditer reports a rule at
+# every position where a marker starts, even when markers overlap (e.g. "cookie" inside
+# "could not copy chrome cookie database").
+DOWNLOAD_ERROR_PATTERN = re.compile(
+    "(?="
+    + "|".join(
+        f"(?P<{rule}>{'|'.join(re.escape(marker) for marker in markers)})"
+        for rule, markers, _ in DOWNLOAD_ERROR_RULES
+    )
+    + ")"
+)
+# Failures a retry cannot fix (DRM, VIP/premium-only, login required); the worker stops
+# retrying these right away. Kept apart from DOWNLOAD_ERROR_RULES, whose plain substrings
+# are tuned for user-facing hints ("pay" also hits "payload"), and word-bounded so only
+# unambiguous wording matches. 403s stay retriable: Bilibili returns them for expired
+# signed URLs and short-lived risk control.
+NON_RETRIABLE_ERROR_PATTERN = re.compile(
+    r"\b(?:drm|vip|premium members?|members[- ]only|login required|requires? (?:a )?login"
+    r"|(?:need|have) to (?:log ?in|sign in))\b",
+    re.IGNORECASE,
+)
+
+# Options that differ between calls on one downloader; everything else keys the
+# cached YoutubeDL instance (see MediaDownloader._get_download_ydl).
+PER_CALL_YDL_OPTIONS = frozenset({"format", "outtmpl", "progress_hooks"})
+
+# Probe metadata shared by every downloader (GUI diagnosis and pool tasks alike),
+# keyed by URL plus the login inputs that change which formats are offered.
+_probe_info_cache: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+_probe_info_lock = threading.Lock()
+
+
+def clear_probe_info_cache() -> None:
+    # Browser cookies (and a re-saved cookie file) change without any key input
+    # changing, so callers drop every entry when the user logs in or out.
+    with _probe_info_lock:
+        _probe_info_cache.clear()
 
 
 class MediaDownloader:
@@ -37,6 +174,7 @@ class MediaDownloader:
         browser_name: BrowserName = "edge",
         cookie_file: Path | None = None,
         logger: Logger | None = None,
+        concurrent_fragments: int = DEFAULT_CONCURRENT_FRAGMENTS,
     ) -> None:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -46,25 +184,50 @@ class MediaDownloader:
         self.browser_name = browser_name
         self.cookie_file = cookie_file
         self.logger = logger or (lambda _: None)
-        self.ffmpeg_available = bool(shutil.which("ffmpeg") and shutil.which("ffprobe"))
+        self.concurrent_fragments = max(1, concurrent_fragments)
+        self.ffmpeg_available = detect_ffmpeg()
         self._last_stream_note = ""
-
-    def download(self, url: str, progress_callback: ProgressCallback | None = None) -> DownloadResult:
+        self._probe_ydl: yt_dlp.YoutubeDL | None = None
+        self._probe_key: tuple | None = None
+        self._download_ydls: dict[str, yt_dlp.YoutubeDL] = {}
+        self._active_progress_hook: Callable[[dict], None] = lambda _: None
+
+    def __enter__(self) -> MediaDownloader:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        instances = list(self._download_ydls.values())
+        self._download_ydls.clear()
+        if self._probe_ydl is not None:
+            instances.append(self._probe_ydl)
+            self._probe_ydl = None
+            self._probe_key = None
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception:  # pragma: no cover - closing is best-effort
+                pass
+
+    def download(
+        self,
+        url: str,
+        progress_callback: ProgressCallback | None = None,
+        filename: str | None = None,
+    ) -> DownloadResult:
         progress_callback = progress_callback or (lambda _: None)
+        safe_name = self._sanitize_filename(filename) if filename else ""
 
         self.logger(f"Preparing ({self.mode}): {url}")
-        ydl_opts = self._build_options(progress_callback)
-        custom_name = getattr(self, "_runtime_filename", None)
-        if custom_name:
-            safe_name = self._sanitize_filename(custom_name)
-            if safe_name:
-                ydl_opts["outtmpl"] = str(self.output_dir / f"{safe_name}.%(ext)s")
+        ydl_opts = self._build_options(progress_callback, safe_name)
 
-        self._apply_preflight_format_selection(url, ydl_opts)
+        info = self._apply_preflight_format_selection(url, ydl_opts)
 
         try:
             self._last_stream_note = ""
-            base_path = self._extract_with_options(url, ydl_opts)
+            base_path = self._extract_with_options(url, ydl_opts, info)
 
             output_path = self._resolve_output_path(base_path)
             if output_path:
@@ -83,7 +246,9 @@ class MediaDownloader:
                 mode=self.mode,
             )
         except yt_dlp.utils.DownloadError as exc:
-            fallback_path, fallback_error = self._try_format_fallback(url, progress_callback, str(exc))
+            # The cached probe may carry expired stream URLs; never replay it after a failure.
+            self._forget_probe_info(url)
+            fallback_path, fallback_error = self._try_format_fallback(url, progress_callback, str(exc), safe_name)
             if fallback_path is not None:
                 output_path = self._resolve_output_path(fallback_path)
                 return DownloadResult(
@@ -93,13 +258,16 @@ class MediaDownloader:
                     output_path=str(output_path) if output_path else None,
                     mode=self.mode,
                 )
+            error_text = fallback_error or str(exc)
             return DownloadResult(
                 url=url,
                 success=False,
-                message=self._map_download_error(fallback_error or str(exc)),
+                message=self._map_download_error(error_text),
                 mode=self.mode,
+                retriable=NON_RETRIABLE_ERROR_PATTERN.search(error_text) is None,
             )
         except Exception as exc:  # pragma: no cover - defensive fallback
+            self._forget_probe_info(url)
             return DownloadResult(
                 url=url,
                 success=False,
@@ -113,17 +281,46 @@ class MediaDownloader:
         filename: str | None,
         progress_callback: ProgressCallback | None = None,
     ) -> DownloadResult:
-        self._runtime_filename = filename
-        try:
-            return self.download(url, progress_callback=progress_callback)
-        finally:
-            self._runtime_filename = None
+        return self.download(url, progress_callback=progress_callback, filename=filename)
+
+    def download_many(
+        self,
+        urls: list[str],
+        progress_callback: BatchProgressCallback | None = None,
+        max_workers: int = 4,
+    ) -> list[DownloadResult]:
+        """Download several URLs concurrently; results keep the order of ``urls``."""
+        progress_callback = progress_callback or (lambda _index, _progress: None)
+
+        def run(index: int, url: str) -> DownloadResult:
+            # YoutubeDL instances and per-download state are not thread-safe,
+            # so every URL gets its own downloader with the same settings.
+            downloader = self._clone()
+            try:
+                return downloader.download(url, progress_callback=partial(progress_callback, index))
+            finally:
+                downloader.close()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(run, range(len(urls)), urls))
+
+    def _clone(self) -> MediaDownloader:
+        clone = MediaDownloader(
+            output_dir=self.output_dir,
+            mode=self.mode,
+            video_quality=self.video_quality,
+            cookie_source=self.cookie_source,
+            browser_name=self.browser_name,
+            cookie_file=self.cookie_file,
+            logger=self.logger,
+            concurrent_fragments=self.concurrent_fragments,
+        )
+        clone.ffmpeg_available = self.ffmpeg_available
+        return clone
 
     def diagnose_formats(self, url: str) -> str:
-        probe_opts = self._build_probe_options()
         try:
-            with yt_dlp.YoutubeDL(probe_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            info = self._probe_info(url)
         except yt_dlp.utils.DownloadError as exc:
             mapped = self._map_download_error(str(exc))
             return f"Format diagnosis failed.\n{mapped}"
@@ -154,24 +351,22 @@ class MediaDownloader:
         if self.cookie_source == "none":
             return "Login diagnosis skipped: cookie source is 'none'."
 
-        probe_opts = self._build_probe_options()
         try:
-            with yt_dlp.YoutubeDL(probe_opts) as ydl:
-                request = urllib.request.Request(BILIBILI_NAV_API, headers={"User-Agent": DEFAULT_UA})
-                response = ydl.urlopen(request)
+            request = urllib.request.Request(BILIBILI_NAV_API, headers={"User-Agent": DEFAULT_UA})
+            with self._get_probe_ydl().urlopen(request) as response:
                 payload = json.loads(response.read().decode("utf-8", errors="ignore"))
         except yt_dlp.utils.DownloadError as exc:
-            raw = re.sub(r"\x1b\[[0-9;]*m", "", str(exc))
+            raw = _strip_ansi(str(exc))
             return f"Login diagnosis failed.\n{self._map_download_error(raw)}\nRaw error: {raw}"
         except Exception as exc:  # pragma: no cover - defensive fallback
             return f"Login diagnosis failed with unexpected error: {exc}"
 
         return self._format_login_report(payload, self.cookie_source)
 
-    def _build_options(self, progress_callback: ProgressCallback) -> dict:
+    def _build_options(self, progress_callback: ProgressCallback, safe_name: str = "") -> dict:
         ydl_opts: dict = {
             "format": self._select_format(),
-            "outtmpl": str(self.output_dir / "%(title)s.%(ext)s"),
+            "outtmpl": str(self.output_dir / f"{safe_name or '%(title)s'}.%(ext)s"),
             "noplaylist": True,
             "quiet": True,
             "no_warnings": True,
@@ -193,33 +388,67 @@ class MediaDownloader:
         elif not self.ffmpeg_available:
             self.logger("FFmpeg not found. Video may be downloaded in a non-merged/source format.")
 
+        if "postprocessors" not in ydl_opts:
+            # MP3 extraction is bound by FFmpeg, not the transfer; tune only direct downloads.
+            ydl_opts["concurrent_fragment_downloads"] = self.concurrent_fragments
+            ydl_opts["http_chunk_size"] = HTTP_CHUNK_SIZE
+
         self._inject_login_options(ydl_opts)
         return ydl_opts
 
     @staticmethod
     def _sanitize_filename(name: str) -> str:
-        cleaned = re.sub(r"[\\/:*?\"<>|]+", "_", name).strip().strip(".")
-        cleaned = re.sub(r"\s+", " ", cleaned)
-        return cleaned[:150]
-
-    def _extract_with_options(self, url: str, ydl_opts: dict) -> Path:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        # Most names are already clean; the set check runs in C and skips the substitution.
+        if not INVALID_FILENAME_CHARS.isdisjoint(name):
+            name = INVALID_FILENAME_PATTERN.sub("_", name)
+        return WHITESPACE_PATTERN.sub(" ", name.strip().strip("."))[:150]
+
+    def _extract_with_options(self, url: str, ydl_opts: dict, info: dict | None = None) -> Path:
+        ydl = self._get_download_ydl(ydl_opts)
+        if info is None:
             info = ydl.extract_info(url, download=True)
-            self._update_stream_note(info)
-            return Path(ydl.prepare_filename(info))
+        else:
+            # Reuse the preflight metadata instead of extracting the page a second time;
+            # this is how yt-dlp itself replays --load-info-json.
+            # sanitize_info() fills defaults in place; work on a copy of the shared cache entry.
+            clean_info = yt_dlp.YoutubeDL.sanitize_info(dict(info), remove_private_keys=True)
+            info = ydl.process_ie_result(clean_info, download=True)
+        self._update_stream_note(info)
+        return Path(ydl.prepare_filename(info))
+
+    def _get_download_ydl(self, ydl_opts: dict) -> yt_dlp.YoutubeDL:
+        # Retries and the format fallback reuse one instance per option set, so extractors,
+        # the cookie jar and cached player JS are loaded once. Format, output template and
+        # progress hook change per call and are applied to the cached instance instead.
+        key = repr(sorted((name, value) for name, value in ydl_opts.items() if name not in PER_CALL_YDL_OPTIONS))
+        ydl = self._download_ydls.get(key)
+        if ydl is None:
+            shared_opts = {name: value for name, value in ydl_opts.items() if name not in PER_CALL_YDL_OPTIONS}
+            shared_opts["progress_hooks"] = [lambda status: self._active_progress_hook(status)]
+            ydl = yt_dlp.YoutubeDL(shared_opts)
+            self._download_ydls[key] = ydl
+        selector = ydl_opts.get("format")
+        if ydl.params.get("format") != selector:
+            ydl.params["format"] = selector
+            ydl.format_selector = ydl.build_format_selector(selector) if selector else None
+        ydl.params["outtmpl"]["default"] = ydl_opts["outtmpl"]
+        hooks = ydl_opts.get("progress_hooks") or [lambda _: None]
+        self._active_progress_hook = hooks[0]
+        return ydl
 
     def _try_format_fallback(
         self,
         url: str,
         progress_callback: ProgressCallback,
         error_text: str,
+        safe_name: str = "",
     ) -> tuple[Path | None, str | None]:
         lowered = error_text.lower()
         if self.mode != "video" or "requested format is not available" not in lowered:
             return None, None
 
         self.logger("Requested format unavailable. Retrying with fallback format...")
-        fallback_opts = self._build_options(progress_callback)
+        fallback_opts = self._build_options(progress_callback, safe_name)
         if self.ffmpeg_available:
             fallback_opts["format"] = "bestvideo+bestaudio/best"
         else:
@@ -230,51 +459,112 @@ class MediaDownloader:
         except yt_dlp.utils.DownloadError as exc:
             return None, str(exc)
 
-    def _apply_preflight_format_selection(self, url: str, ydl_opts: dict) -> None:
+    def _apply_preflight_format_selection(self, url: str, ydl_opts: dict) -> dict | None:
+        """Pick the video format up front; returns the probed metadata so the download can reuse it."""
         if self.mode != "video":
-            return
+            return None
 
-        probe_opts = self._build_probe_options()
         try:
-            with yt_dlp.YoutubeDL(probe_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            info = self._probe_info(url)
             formats = info.get("formats") if isinstance(info, dict) else None
             if not isinstance(formats, list):
-                return
+                return None
 
             selected = self._pick_video_format_selector(formats)
             if selected:
                 ydl_opts["format"] = selected
                 self.logger(f"Preflight selected format: {selected}")
+            return info
         except Exception:
             # Probe is best-effort only; normal download flow continues.
-            return
+            return None
+
+    def _probe_info(self, url: str) -> dict | None:
+        key = self._probe_cache_key(url)
+        with _probe_info_lock:
+            cached = _probe_info_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < PROBE_INFO_TTL_SECONDS:
+                _probe_info_cache.move_to_end(key)
+                return cached[1]
+
+        info = self._get_probe_ydl().extract_info(url, download=False)
+        if not isinstance(info, dict):
+            return None
+        with _probe_info_lock:
+            _probe_info_cache[key] = (time.monotonic(), info)
+            _probe_info_cache.move_to_end(key)
+            while len(_probe_info_cache) > PROBE_INFO_CACHE_SIZE:
+                _probe_info_cache.popitem(last=False)
+        return info
+
+    def _forget_probe_info(self, url: str) -> None:
+        with _probe_info_lock:
+            _probe_info_cache.pop(self._probe_cache_key(url), None)
+
+    def _probe_cache_key(self, url: str) -> tuple:
+        return (url, *self._login_key())
+
+    def _login_key(self) -> tuple:
+        # QR login rewrites the same cookie file, so its mtime is part of the login identity.
+        mtime = None
+        if self.cookie_source == "file" and self.cookie_file:
+            try:
+                mtime = self.cookie_file.stat().st_mtime_ns
+            except OSError:
+                pass
+        return (self.cookie_source, self.browser_name, self.cookie_file, mtime)
+
+    def _get_probe_ydl(self) -> yt_dlp.YoutubeDL:
+        # Probing never downloads, so one instance (and its loaded cookie jar)
+        # serves every probe until the login inputs change. A browser's cookie
+        # store changes with no visible input, so browser mode reloads it per probe.
+        key = self._login_key()
+        if self._probe_ydl is None or self._probe_key != key or self.cookie_source == "browser":
+            # Replace only the probe instance; cached download instances stay reusable.
+            if self._probe_ydl is not None:
+                self._probe_ydl.close()
+            self._probe_ydl = yt_dlp.YoutubeDL(self._build_probe_options())
+            self._probe_key = key
+        return self._probe_ydl
 
     def _build_probe_options(self) -> dict:
-        probe_opts = self._build_options(lambda _: None)
-        probe_opts["skip_download"] = True
-        probe_opts["progress_hooks"] = []
-        # Do not force a format during probing, otherwise yt-dlp can fail
-        # before returning the format list when preferred selector is unavailable.
-        probe_opts.pop("format", None)
-        probe_opts.pop("postprocessors", None)
+        # Metadata only: no format (yt-dlp can fail before returning the format list when
+        # the preferred selector is unavailable), output template, hooks or postprocessors.
+        probe_opts: dict = {"quiet": True, "no_warnings": True, "skip_download": True, "noplaylist": True}
+        self._inject_login_options(probe_opts)
         return probe_opts
 
     def _pick_video_format_selector(self, formats: list[dict]) -> str | None:
         target_height = self._quality_height_limit()
-        if self.ffmpeg_available:
-            videos = self._filter_video_only_formats(formats)
-            audios = self._filter_audio_only_formats(formats)
-            videos = self._apply_height_cap(videos, target_height)
+        # Single pass over the formats. Video-like kinds also keep a best-within-cap
+        # entry, so the height cap can fall back to every format when none fit.
+        best: dict[str, tuple[tuple, dict]] = {}
+        for fmt in formats:
+            if not fmt.get("format_id"):
+                continue
+            has_video = fmt.get("vcodec") not in (None, "none")
+            has_audio = fmt.get("acodec") not in (None, "none")
+            if has_video:
+                kind = "progressive" if has_audio else "video"
+                score = self._video_score(fmt)
+                self._keep_best(best, kind, score, fmt)
+                # score[0] is the parsed height; no second lookup on the format dict.
+                if target_height is not None and 0 < score[0] <= target_height:
+                    self._keep_best(best, f"{kind}_capped", score, fmt)
+            elif has_audio:
+                self._keep_best(best, "audio", self._audio_score(fmt), fmt)
+
+        def pick(kind: str) -> dict | None:
+            entry = best.get(f"{kind}_capped") or best.get(kind)
+            return entry[1] if entry else None
 
-            best_video = self._pick_best_by_score(videos, self._video_score)
-            best_audio = self._pick_best_by_score(audios, self._audio_score)
+        if self.ffmpeg_available:
+            best_video = pick("video")
+            best_audio = pick("audio")
             if best_video and best_audio:
                 return f"{best_video['format_id']}+{best_audio['format_id']}"
 
-        progressive = self._filter_progressive_formats(formats)
-        progressive = self._apply_height_cap(progressive, target_height)
-        best_progressive = self._pick_best_by_score(progressive, self._video_score)
+        best_progressive = pick("progressive")
         if best_progressive:
             return str(best_progressive["format_id"])
         return None
@@ -309,47 +599,11 @@ class MediaDownloader:
         return None
 
     @staticmethod
-    def _filter_video_only_formats(formats: list[dict]) -> list[dict]:
-        return [
-            fmt
-            for fmt in formats
-            if fmt.get("format_id")
-            and fmt.get("vcodec") not in (None, "none")
-            and fmt.get("acodec") in (None, "none")
-        ]
-
-    @staticmethod
-    def _filter_audio_only_formats(formats: list[dict]) -> list[dict]:
-        return [
-            fmt
-            for fmt in formats
-            if fmt.get("format_id")
-            and fmt.get("acodec") not in (None, "none")
-            and fmt.get("vcodec") in (None, "none")
-        ]
-
-    @staticmethod
-    def _filter_progressive_formats(formats: list[dict]) -> list[dict]:
-        return [
-            fmt
-            for fmt in formats
-            if fmt.get("format_id")
-            and fmt.get("acodec") not in (None, "none")
-            and fmt.get("vcodec") not in (None, "none")
-        ]
-
-    @staticmethod
-    def _apply_height_cap(formats: list[dict], target_height: int | None) -> list[dict]:
-        if not formats or target_height is None:
-            return formats
-        capped = [fmt for fmt in formats if (fmt.get("height") or 0) and (fmt.get("height") or 0) <= target_height]
-        return capped or formats
-
-    @staticmethod
-    def _pick_best_by_score(formats: list[dict], score_fn: Callable[[dict], tuple]) -> dict | None:
-        if not formats:
-            return None
-        return max(formats, key=score_fn)
+    def _keep_best(best: dict[str, tuple[tuple, dict]], kind: str, score: tuple, fmt: dict) -> None:
+        # Strict comparison keeps the first format on ties, like max().
+        current = best.get(kind)
+        if current is None or score > current[0]:
+            best[kind] = (score, fmt)
 
     @staticmethod
     def _video_score(fmt: dict) -> tuple:
@@ -373,28 +627,22 @@ class MediaDownloader:
                 str(fmt.get("format_id") or ""),
             )
 
-        sorted_formats = sorted(
-            [fmt for fmt in formats if fmt.get("format_id")],
-            key=sort_key,
-            reverse=True,
+        # nlargest() matches sorted(..., reverse=True)[:limit] without sorting the whole list.
+        top_formats = heapq.nlargest(max(1, limit), (fmt for fmt in formats if fmt.get("format_id")), key=sort_key)
+        return "\n".join(map(MediaDownloader._format_row, top_formats)) or "(none)"
+
+    @staticmethod
+    def _format_row(fmt: dict) -> str:
+        height = fmt.get("height")
+        fps = fmt.get("fps")
+        tbr = fmt.get("tbr")
+        quality = f"{height}p" if height else (str(fmt.get("resolution")) if fmt.get("resolution") else "-")
+        fps_text = f"{int(fps)}fps" if fps else "-"
+        tbr_text = f"{float(tbr):.0f}k" if tbr else "-"
+        return (
+            f"- id={fmt.get('format_id')} ext={fmt.get('ext') or '-'} quality={quality} fps={fps_text} "
+            f"tbr={tbr_text} v={fmt.get('vcodec') or 'none'} a={fmt.get('acodec') or 'none'}"
         )
-        rows: list[str] = []
-        for fmt in sorted_formats[: max(1, limit)]:
-            fid = str(fmt.get("format_id"))
-            ext = str(fmt.get("ext") or "-")
-            height = fmt.get("height")
-            fps = fmt.get("fps")
-            acodec = str(fmt.get("acodec") or "none")
-            vcodec = str(fmt.get("vcodec") or "none")
-            tbr = fmt.get("tbr")
-            quality = f"{height}p" if height else (str(fmt.get("resolution")) if fmt.get("resolution") else "-")
-            fps_text = f"{int(fps)}fps" if fps else "-"
-            tbr_text = f"{float(tbr):.0f}k" if tbr else "-"
-            rows.append(
-                f"- id={fid} ext={ext} quality={quality} fps={fps_text} tbr={tbr_text} "
-                f"v={vcodec} a={acodec}"
-            )
-        return "\n".join(rows) if rows else "(none)"
 
     @staticmethod
     def _format_login_report(payload: dict, cookie_source: CookieSource) -> str:
@@ -475,50 +723,37 @@ class MediaDownloader:
         if base_path.exists():
             return base_path
 
-        matches = list(base_path.parent.glob(f"{base_path.stem}.*"))
-        if matches:
-            return matches[0]
+        extensions = AUDIO_OUTPUT_EXTENSIONS if self.mode == "audio" else VIDEO_OUTPUT_EXTENSIONS
+        for extension in extensions:
+            candidate = base_path.with_suffix(extension)
+            if candidate.exists():
+                return candidate
+
+        # Plain prefix match: titles often contain "[...]", which glob would treat as a pattern.
+        self.logger(f"Output file not found by extension, scanning folder: {base_path.parent}")
+        prefix = f"{base_path.stem}."
+        try:
+            with os.scandir(base_path.parent) as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix) and entry.is_file():
+                        return base_path.parent / entry.name
+        except OSError:
+            pass
 
         return None
 
+    @staticmethod
+    def _download_error_rule(cleaned_error: str) -> str | None:
+        # Every marker position is visited once; the earliest rule in DOWNLOAD_ERROR_RULES wins.
+        matched = {match.lastgroup for match in DOWNLOAD_ERROR_PATTERN.finditer(cleaned_error.lower())}
+        return min(matched, key=DOWNLOAD_ERROR_PRIORITY.__getitem__, default=None)
+
     def _map_download_error(self, raw_error: str) -> str:
-        cleaned_error = re.sub(r"\x1b\[[0-9;]*m", "", raw_error)
-        lowered = cleaned_error.lower()
-        if "drm" in lowered:
-            return "Download failed: DRM-protected content cannot be downloaded by yt-dlp."
-        if "ffmpeg is not installed" in lowered:
-            return (
-                "Download failed: ffmpeg is missing. Install ffmpeg for high-quality merged video, "
-                "or keep current setup and the app will fallback to single-stream video."
-            )
-        if "winerror 10013" in lowered or "access permissions" in lowered:
-            return (
-                "Download failed: Local network/socket permission denied (WinError 10013). "
-                "Please check firewall/proxy/security software."
-            )
-        if "http error 403" in lowered or "forbidden" in lowered:
-            return "Download failed: Access denied (403). Login/VIP permission may be required."
-        if "http error 412" in lowered:
-            return "Download failed: Request blocked by platform risk control. Retry later or use valid login cookies."
-        if "unable to extract" in lowered:
-            return "Download failed: The page format may have changed. Try updating yt-dlp."
-        if "vip" in lowered or "pay" in lowered or "premium" in lowered:
-            return "Download failed: This content likely requires VIP/payment access with a valid logged-in account."
-        if "cookie" in lowered or "login" in lowered:
-            return "Download failed: Login may be required. Configure browser/file cookies and retry."
-        if "decrypt" in lowered or "dpapi" in lowered or "keyring" in lowered:
-            return (
-                "Download failed: Browser cookies could not be decrypted/read (DPAPI). "
-                "Try updating yt-dlp and run app under your normal user session."
-            )
-        if "could not copy chrome cookie database" in lowered or "permission denied" in lowered:
-            return (
-                "Download failed: Browser cookie database is locked or inaccessible. "
-                "Close browser completely and retry."
-            )
-        if "geo" in lowered or "region" in lowered:
-            return "Download failed: Region-locked content is not available in your current area."
-        if "requested format is not available" in lowered:
+        cleaned_error = _strip_ansi(raw_error)
+        rule = self._download_error_rule(cleaned_error)
+        if rule is None:
+            return f"Download failed: {cleaned_error}"
+        if rule == "format_unavailable":
             if not self.ffmpeg_available and self.mode == "video":
                 return (
                     "Download failed: This video likely provides separate video/audio streams. "
@@ -528,17 +763,38 @@ class MediaDownloader:
                 "Download failed: Requested quality/format is unavailable. "
                 f"Try video quality Auto or login cookies for higher tiers. Raw error: {cleaned_error}"
             )
-        return f"Download failed: {cleaned_error}"
+        return DOWNLOAD_ERROR_MESSAGES[rule]
 
     @staticmethod
     def _build_progress_hook(progress_callback: ProgressCallback):
+        # yt-dlp calls the hook per received chunk; forward at most one update per
+        # PROGRESS_MIN_INTERVAL_SECONDS, and only on whole-percent changes unless
+        # PROGRESS_REFRESH_INTERVAL_SECONDS has passed.
+        last_percent = -1
+        last_emit = float("-inf")
+        last_percent_str = None
+        message = "Downloading"
+
         def hook(status: dict) -> None:
-            state = status.get("status")
+            nonlocal last_percent, last_emit, last_percent_str, message
+            get = status.get
+            state = get("status")
             if state == "downloading":
-                downloaded = status.get("downloaded_bytes", 0)
-                total = status.get("total_bytes") or status.get("total_bytes_estimate") or 0
+                now = time.monotonic()
+                elapsed = now - last_emit
+                if elapsed < PROGRESS_MIN_INTERVAL_SECONDS:
+                    return
+                downloaded = get("downloaded_bytes", 0)
+                total = get("total_bytes") or get("total_bytes_estimate") or 0
                 percent = (downloaded / total * 100) if total else 0.0
-                message = status.get("_percent_str", "").strip() or "Downloading"
+                if int(percent) == last_percent and elapsed < PROGRESS_REFRESH_INTERVAL_SECONDS:
+                    return
+                last_percent = int(percent)
+                last_emit = now
+                percent_str = get("_percent_str", "")
+                if percent_str != last_percent_str:
+                    last_percent_str = percent_str
+                    message = percent_str.strip() or "Downloading"
                 progress_callback(ProgressUpdate(percent=percent, message=message))
             elif state == "finished":
                 progress_callback(ProgressUpdate(percent=100.0, message="Download finished"))
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-import json
 import os
-import re
-import shutil
-import tempfile
 import time
-from datetime import datetime
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
 
-from PySide6.QtCore import QProcess, QSettings, QThread, QTimer, Qt
-from PySide6.QtGui import QCloseEvent
+from PySide6.QtCore import QSettings, QTimer, Qt
+from PySide6.QtGui import QCloseEvent, QImage, QPixmap
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -29,51 +29,145 @@ from PySide6.QtWidgets import (
     QPushButton,
     QDialog,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from .config import APP_NAME, APP_ORG, APP_VERSION, DEFAULT_DOWNLOAD_DIR
-from .downloader import MediaDownloader
+from .downloader import MediaDownloader, clear_probe_info_cache, detect_ffmpeg
 from .qr_login import BilibiliQrLoginClient, QrLoginError
-from .models import DownloadTask
-from .url_parser import diagnose_urls, parse_download_entries
-from .worker import DownloadWorker
+from .models import BrowserName, CookieSource, DownloadMode, DownloadTask, VideoQuality
+from .settings_cache import CachedSettings
+from .table_models import RowTableModel, SpeedUpDelegate
+from .throttle import qthrottled
+from .url_parser import diagnose_urls, parse_download_entries, parse_task_rows
+from .worker import MAX_PARALLEL_DOWNLOADS, DownloadWorker
+
+QR_LIFETIME_SECONDS = 180
+QR_POLL_INTERVAL_MS = 3600
+QR_IMAGE_SIZE = 320
+FFMPEG_REPROBE_SECONDS = 30
+UI_THROTTLE_MS = 50
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_MAX_LINES = 5000
+PROGRESS_FLUSH_INTERVAL_MS = 100
+HISTORY_MAX_ENTRIES = 300
+HISTORY_DISPLAY_ENTRIES = 100
+HISTORY_FLUSH_INTERVAL_MS = 250
+HISTORY_FIELDS = ("time", "mode", "status", "url", "message")
+HISTORY_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Written as bytes with explicit CRLF, matching what cmd.exe expects.
+FFMPEG_INSTALL_SCRIPT = (
+    b"@echo off\r\n"
+    b"title MediaPorter FFmpeg Installer\r\n"
+    b"winget install --id Gyan.FFmpeg -e --source winget --verbose "
+    b"--accept-package-agreements --accept-source-agreements\r\n"
+    b"echo.\r\n"
+    b"echo Installation command finished.\r\n"
+    b"echo Please close this window and return to MediaPorter.\r\n"
+    b"pause\r\n"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class UiSnapshot:
+    output_dir: Path
+    max_retries: int
+    max_parallel: int
+    mode: DownloadMode
+    video_quality: VideoQuality
+    cookie_source: CookieSource
+    browser_name: BrowserName
+    cookie_file: Path | None
+
+
+@contextmanager
+def _table_batch(table: QTableView) -> Iterator[QTableView]:
+    # Populate many rows with a single repaint and no per-cell signal traffic.
+    # Fixed headers also skip section-width recomputation while rows change.
+    header = table.horizontalHeader()
+    resize_modes = [header.sectionResizeMode(section) for section in range(header.count())]
+    sorting_enabled = table.isSortingEnabled()
+    signals_blocked = table.blockSignals(True)
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    try:
+        yield table
+    finally:
+        for section, mode in enumerate(resize_modes):
+            header.setSectionResizeMode(section, mode)
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting_enabled)
+        table.blockSignals(signals_blocked)
+        # Re-enabling updates only repaints the view frame; schedule the one cell repaint explicitly.
+        table.viewport().update()
+
+
+def _descending_row_ranges(rows: list[int]) -> list[tuple[int, int]]:
+    # Collapse rows sorted in descending order into (start, count) runs,
+    # still ordered bottom-up so earlier removals don't shift later ones.
+    ranges: list[tuple[int, int]] = []
+    for row in rows:
+        if ranges and ranges[-1][0] - 1 == row:
+            start, count = ranges[-1]
+            ranges[-1] = (row, count + 1)
+        else:
+            ranges.append((row, 1))
+    return ranges
 
 
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
-        self.thread: QThread | None = None
         self.worker: DownloadWorker | None = None
         self.completed_tasks = 0
         self.total_tasks = 0
         self.current_tasks: list[DownloadTask] = []
         self.failed_tasks: list[DownloadTask] = []
+        self._failed_task_urls: set[str] = set()
         self.active_mode = "audio"
-        self.history_entries: list[dict[str, str]] = []
-        self.settings = QSettings(APP_ORG, APP_NAME)
-        self.ffmpeg_available = bool(shutil.which("ffmpeg") and shutil.which("ffprobe"))
-        self.install_process: QProcess | None = None
-        self._install_log_buffer = ""
-        self._install_last_percent = -1
-        self._install_last_ratio_text = ""
-        self._install_last_output_ts = 0.0
-        self._install_stall_warned = False
-        self.install_watchdog = QTimer(self)
-        self.install_watchdog.setInterval(5000)
-        self.install_watchdog.timeout.connect(self._check_install_stall)
+        self.history_entries: deque[dict[str, str]] = deque(maxlen=HISTORY_MAX_ENTRIES)
+        self._history_dirty = False
+        self.settings = CachedSettings(QSettings(APP_ORG, APP_NAME))
+        self.ffmpeg_available = False
+        self._ffmpeg_probe_ts = 0.0
+        self._probe_ffmpeg()
+        self._ffmpeg_bat_path: Path | None = None
         self.qr_login_dialog: QDialog | None = None
-        self.qr_login_timer = QTimer(self)
-        self.qr_login_timer.setInterval(1800)
-        self.qr_login_timer.timeout.connect(self._poll_qr_login)
+        self.qr_poll_timer = QTimer(self)
+        self.qr_poll_timer.setSingleShot(True)
+        self.qr_poll_timer.setInterval(QR_POLL_INTERVAL_MS)
+        self.qr_poll_timer.timeout.connect(self._do_qr_network_poll)
+        self.qr_countdown_timer = QTimer(self)
+        self.qr_countdown_timer.setSingleShot(True)
+        self.qr_countdown_timer.setInterval(1000)
+        self.qr_countdown_timer.timeout.connect(self._tick_qr_countdown)
         self.qr_login_client: BilibiliQrLoginClient | None = None
         self.qr_login_key: str = ""
         self.qr_confirm_url: str | None = None
-        self.qr_remaining_seconds = 180
-        self.qr_poll_tick = 0
+        self._qr_deadline = 0.0
+        self._qr_factory = None
+        self._downloader: MediaDownloader | None = None
+        self._downloader_key: tuple | None = None
+        self._log_buf: deque[str] = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        # yt-dlp reports progress per received chunk; keep only the latest state per row
+        # and paint it at most every PROGRESS_FLUSH_INTERVAL_MS.
+        self._pending_progress: dict[int, tuple[float, str]] = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._pending_history_rows: list[list[str]] = []
+        self._history_flush_timer = QTimer(self)
+        self._history_flush_timer.setSingleShot(True)
+        self._history_flush_timer.setInterval(HISTORY_FLUSH_INTERVAL_MS)
+        self._history_flush_timer.timeout.connect(self._flush_history_rows)
         self._qr_status_label: QLabel | None = None
         self._qr_countdown_label: QLabel | None = None
         self._qr_image_label: QLabel | None = None
@@ -98,8 +192,9 @@ class MainWindow(QMainWindow):
         )
         input_layout.addWidget(self.url_input)
 
-        self.task_editor = QTableWidget(0, 2)
-        self.task_editor.setHorizontalHeaderLabels(["Task URL", "Custom File Name"])
+        self.task_model = RowTableModel(["Task URL", "Custom File Name"], editable_columns=(0, 1), parent=self)
+        self.task_editor = QTableView()
+        self.task_editor.setModel(self.task_model)
         self.task_editor.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.task_editor.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.task_editor.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
@@ -145,6 +240,12 @@ class MainWindow(QMainWindow):
         self.retry_spin.setRange(0, 5)
         self.retry_spin.setValue(1)
         output_layout.addWidget(self.retry_spin, 3, 1)
+
+        output_layout.addWidget(QLabel("Parallel downloads:"), 4, 0)
+        self.parallel_spin = QSpinBox()
+        self.parallel_spin.setRange(1, MAX_PARALLEL_DOWNLOADS)
+        self.parallel_spin.setValue(min(os.cpu_count() or 1, MAX_PARALLEL_DOWNLOADS))
+        output_layout.addWidget(self.parallel_spin, 4, 1)
         layout.addWidget(output_box)
 
         env_box = QGroupBox("Environment")
@@ -154,10 +255,9 @@ class MainWindow(QMainWindow):
         self.env_status.setMaximumHeight(66)
         env_layout.addWidget(self.env_status)
         self.install_ffmpeg_button = QPushButton("Install FFmpeg (Auto)")
-        self.stop_install_button = QPushButton("Stop Installer")
-        self.stop_install_button.setEnabled(False)
+        self.recheck_ffmpeg_button = QPushButton("Re-check FFmpeg")
         env_layout.addWidget(self.install_ffmpeg_button)
-        env_layout.addWidget(self.stop_install_button)
+        env_layout.addWidget(self.recheck_ffmpeg_button)
         layout.addWidget(env_box)
 
         login_box = QGroupBox("Login (for VIP/paid content if your account has access)")
@@ -205,8 +305,14 @@ class MainWindow(QMainWindow):
         self.progress.setValue(0)
         layout.addWidget(self.progress)
 
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["URL", "File Name", "Status", "Progress", "Message"])
+        self.results_model = RowTableModel(
+            ["URL", "File Name", "Status", "Progress", "Message"],
+            tooltip_columns=(4,),
+            parent=self,
+        )
+        self.table = QTableView()
+        self.table.setModel(self.results_model)
+        self.table.setItemDelegate(SpeedUpDelegate(self.table))
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setSelectionBehavior(QAbstractItemView.SelectItems)
@@ -231,13 +337,16 @@ class MainWindow(QMainWindow):
         log_layout = QVBoxLayout(log_box)
         self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(LOG_MAX_LINES)
         log_layout.addWidget(self.log_view)
         layout.addWidget(log_box)
 
         history_box = QGroupBox("Download History")
         history_layout = QVBoxLayout(history_box)
-        self.history_table = QTableWidget(0, 5)
-        self.history_table.setHorizontalHeaderLabels(["Time", "Mode", "Status", "URL", "Message"])
+        self.history_model = RowTableModel(["Time", "Mode", "Status", "URL", "Message"], parent=self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
+        self.history_table.setItemDelegate(SpeedUpDelegate(self.history_table))
         self.history_table.verticalHeader().setVisible(False)
         self.history_table.setSelectionMode(QAbstractItemView.NoSelection)
         self.history_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
@@ -252,23 +361,31 @@ class MainWindow(QMainWindow):
         self._refresh_env_status()
 
     def _connect_events(self) -> None:
-        self.browse_button.clicked.connect(self._pick_directory)
-        self.start_button.clicked.connect(self.start_download)
-        self.diagnose_button.clicked.connect(self.diagnose_formats)
-        self.retry_failed_button.clicked.connect(self.retry_failed_download)
-        self.stop_button.clicked.connect(self.stop_download)
-        self.cookie_file_button.clicked.connect(self._pick_cookie_file)
-        self.cookie_source_combo.currentIndexChanged.connect(self._refresh_login_ui)
-        self.mode_combo.currentIndexChanged.connect(self._refresh_mode_ui)
-        self.clear_history_button.clicked.connect(self._clear_history)
-        self.table.currentCellChanged.connect(self._on_table_current_cell_changed)
-        self.install_ffmpeg_button.clicked.connect(self.install_ffmpeg)
-        self.stop_install_button.clicked.connect(self.stop_install_ffmpeg)
-        self.open_bilibili_login_button.clicked.connect(self.open_bilibili_login)
-        self.check_login_button.clicked.connect(self.check_login_status)
-        self.load_tasks_button.clicked.connect(self.load_tasks_from_text)
-        self.add_task_row_button.clicked.connect(self.add_task_row)
-        self.remove_task_row_button.clicked.connect(self.remove_selected_task_rows)
+        # Every sender here lives on the GUI thread; skip AutoConnection's per-emit thread check.
+        direct = Qt.DirectConnection
+        self.browse_button.clicked.connect(self._pick_directory, direct)
+        self.start_button.clicked.connect(self.start_download, direct)
+        self.diagnose_button.clicked.connect(self.diagnose_formats, direct)
+        self.retry_failed_button.clicked.connect(self.retry_failed_download, direct)
+        self.stop_button.clicked.connect(self.stop_download, direct)
+        self.cookie_file_button.clicked.connect(self._pick_cookie_file, direct)
+        self.cookie_source_combo.currentIndexChanged.connect(self._refresh_login_ui, direct)
+        self.mode_combo.currentIndexChanged.connect(
+            qthrottled(lambda _index: self._refresh_mode_ui(), UI_THROTTLE_MS, self),
+            direct,
+        )
+        self.clear_history_button.clicked.connect(self._clear_history, direct)
+        self.table.selectionModel().currentChanged.connect(
+            qthrottled(lambda _current, _previous: self._on_table_current_changed(), UI_THROTTLE_MS, self),
+            direct,
+        )
+        self.install_ffmpeg_button.clicked.connect(self.install_ffmpeg, direct)
+        self.recheck_ffmpeg_button.clicked.connect(self.recheck_ffmpeg, direct)
+        self.open_bilibili_login_button.clicked.connect(self.open_bilibili_login, direct)
+        self.check_login_button.clicked.connect(self.check_login_status, direct)
+        self.load_tasks_button.clicked.connect(self.load_tasks_from_text, direct)
+        self.add_task_row_button.clicked.connect(self.add_task_row, direct)
+        self.remove_task_row_button.clicked.connect(self.remove_selected_task_rows, direct)
 
     def _load_settings(self) -> None:
         download_dir = self.settings.value("download_dir", str(DEFAULT_DOWNLOAD_DIR), type=str)
@@ -276,6 +393,8 @@ class MainWindow(QMainWindow):
 
         max_retries = self.settings.value("max_retries", 1, type=int)
         self.retry_spin.setValue(max(0, min(5, max_retries)))
+        max_parallel = self.settings.value("max_parallel", self.parallel_spin.value(), type=int)
+        self.parallel_spin.setValue(max(1, min(MAX_PARALLEL_DOWNLOADS, max_parallel)))
 
         mode = self.settings.value("download_mode", "audio", type=str)
         self._set_combo_by_data(self.mode_combo, mode, "audio")
@@ -289,18 +408,7 @@ class MainWindow(QMainWindow):
         cookie_file = self.settings.value("cookie_file", "", type=str)
         self.cookie_file_input.setText(cookie_file)
 
-        history_json = self.settings.value("download_history_json", "[]", type=str)
-        try:
-            parsed_history = json.loads(history_json)
-            if isinstance(parsed_history, list):
-                self.history_entries = [
-                    entry
-                    for entry in parsed_history
-                    if isinstance(entry, dict)
-                    and all(key in entry for key in ("time", "mode", "status", "url", "message"))
-                ]
-        except json.JSONDecodeError:
-            self.history_entries = []
+        self._load_history()
         self._refresh_history_table()
 
         geometry = self.settings.value("window_geometry")
@@ -311,30 +419,65 @@ class MainWindow(QMainWindow):
         self._refresh_login_ui()
         self.retry_failed_button.setEnabled(bool(self.failed_tasks))
 
-    def _save_settings(self) -> None:
+    def _load_history(self) -> None:
+        self.history_entries.clear()
+        size = self.settings.beginReadArray("history")
+        for index in range(size):
+            self.settings.setArrayIndex(index)
+            self.history_entries.append({key: self.settings.value(key, "", type=str) for key in HISTORY_FIELDS})
+        self.settings.endArray()
+        self._history_dirty = False
+
+        # One-time migration from the JSON blob used by earlier versions.
+        legacy_json = self.settings.value("download_history_json", "", type=str)
+        if not legacy_json:
+            return
+        import json
+
+        try:
+            parsed_history = json.loads(legacy_json)
+        except json.JSONDecodeError:
+            parsed_history = []
+        if not size and isinstance(parsed_history, list):
+            self.history_entries.extend(
+                entry
+                for entry in parsed_history
+                if isinstance(entry, dict) and all(key in entry for key in HISTORY_FIELDS)
+            )
+        self.settings.remove("download_history_json")
+        self._history_dirty = True
+
+    def _save_history(self) -> None:
+        self.settings.beginWriteArray("history", len(self.history_entries))
+        for index, entry in enumerate(self.history_entries):
+            self.settings.setArrayIndex(index)
+            for key in HISTORY_FIELDS:
+                self.settings.setValue(key, entry[key])
+        self.settings.endArray()
+
+    def _save_settings(self, background: bool = False) -> None:
         self.settings.setValue("download_dir", self.output_dir.text().strip())
         self.settings.setValue("max_retries", self.retry_spin.value())
+        self.settings.setValue("max_parallel", self.parallel_spin.value())
         self.settings.setValue("download_mode", self.mode_combo.currentData())
         self.settings.setValue("video_quality", self.quality_combo.currentData())
         self.settings.setValue("cookie_source", self.cookie_source_combo.currentData())
         self.settings.setValue("browser_name", self.browser_combo.currentData())
         self.settings.setValue("cookie_file", self.cookie_file_input.text().strip())
-        self.settings.setValue("download_history_json", json.dumps(self.history_entries[-300:], ensure_ascii=True))
-        self.settings.setValue("window_geometry", self.saveGeometry())
-        self.settings.sync()
+        if self._history_dirty:
+            self._save_history()
+            self._history_dirty = False
+        if background:
+            self.settings.sync_in_background()
+        else:
+            self.settings.sync()
 
     def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802 - Qt naming convention
-        if self.install_process and self.install_process.state() != QProcess.NotRunning:
-            answer = QMessageBox.question(
-                self,
-                APP_NAME,
-                "FFmpeg installation is still running. Stop installation and exit?",
-            )
-            if answer != QMessageBox.Yes:
-                event.ignore()
-                return
-            self._stop_install_process()
-
+        self._drop_cached_downloader()
+        self._log_flush_timer.stop()
+        self._flush_log()
+        # Geometry only matters for the next launch; batch-end saves skip it.
+        self.settings.setValue("window_geometry", self.saveGeometry())
         self._save_settings()
         super().closeEvent(event)
 
@@ -363,6 +506,11 @@ class MainWindow(QMainWindow):
         self._refresh_env_status()
 
     def _refresh_login_ui(self) -> None:
+        # Cookie inputs (or the cookie file contents after QR login) may have
+        # changed; a cached downloader would keep serving the old cookie jar, and
+        # cached probes would keep offering the formats of the previous login.
+        self._drop_cached_downloader()
+        clear_probe_info_cache()
         source = self.cookie_source_combo.currentData()
         use_browser = source == "browser"
         use_file = source == "file"
@@ -370,8 +518,17 @@ class MainWindow(QMainWindow):
         self.cookie_file_input.setEnabled(use_file)
         self.cookie_file_button.setEnabled(use_file)
 
-    def _refresh_env_status(self) -> None:
-        self.ffmpeg_available = bool(shutil.which("ffmpeg") and shutil.which("ffprobe"))
+    def _probe_ffmpeg(self) -> None:
+        detect_ffmpeg.cache_clear()
+        self.ffmpeg_available = detect_ffmpeg()
+        self._ffmpeg_probe_ts = time.monotonic()
+
+    def _refresh_env_status(self, reprobe: bool = False) -> None:
+        # PATH lookups are costly on Windows; only re-probe when asked or while
+        # FFmpeg is still missing and the last probe is stale.
+        stale = not self.ffmpeg_available and time.monotonic() - self._ffmpeg_probe_ts > FFMPEG_REPROBE_SECONDS
+        if reprobe or stale:
+            self._probe_ffmpeg()
         mode = self.mode_combo.currentData()
         if self.ffmpeg_available:
             text = "FFmpeg status: available (ffmpeg + ffprobe found)."
@@ -383,9 +540,7 @@ class MainWindow(QMainWindow):
         else:
             text = "FFmpeg status: missing. Audio mode still works (source format fallback)."
         self.env_status.setPlainText(text)
-        is_installing = bool(self.install_process and self.install_process.state() != QProcess.NotRunning)
-        self.install_ffmpeg_button.setEnabled((not self.ffmpeg_available) and (not is_installing))
-        self.stop_install_button.setEnabled(is_installing)
+        self.install_ffmpeg_button.setEnabled(not self.ffmpeg_available)
 
     def start_download(self, checked: bool = False) -> None:
         del checked  # Qt clicked(bool) compatibility.
@@ -405,28 +560,30 @@ class MainWindow(QMainWindow):
 
     def add_task_row(self, checked: bool = False) -> None:
         del checked
-        row = self.task_editor.rowCount()
-        self.task_editor.insertRow(row)
-        self.task_editor.setItem(row, 0, QTableWidgetItem(""))
-        self.task_editor.setItem(row, 1, QTableWidgetItem(""))
+        self.task_model.append_row(["", ""])
 
     def remove_selected_task_rows(self, checked: bool = False) -> None:
         del checked
-        selected_rows = sorted({index.row() for index in self.task_editor.selectedIndexes()}, reverse=True)
-        for row in selected_rows:
-            self.task_editor.removeRow(row)
+        selected = self.task_editor.selectionModel().selectedRows()
+        selected_rows = sorted({index.row() for index in selected}, reverse=True)
+        with _table_batch(self.task_editor):
+            for start, count in _descending_row_ranges(selected_rows):
+                self.task_model.removeRows(start, count)
+
+    def recheck_ffmpeg(self, checked: bool = False) -> None:
+        del checked
+        self._refresh_env_status(reprobe=True)
+        self._append_log(f"FFmpeg re-check: {'available' if self.ffmpeg_available else 'missing'}.")
 
     def install_ffmpeg(self, checked: bool = False) -> None:
         del checked  # Qt clicked(bool) compatibility.
+        self._probe_ffmpeg()
         if self.ffmpeg_available:
             QMessageBox.information(self, APP_NAME, "FFmpeg is already installed.")
             return
-        if self.thread and self.thread.isRunning():
+        if self.worker is not None:
             QMessageBox.information(self, APP_NAME, "Please wait until current download tasks finish.")
             return
-        if self.install_process and self.install_process.state() != QProcess.NotRunning:
-            QMessageBox.information(self, APP_NAME, "FFmpeg installation is already running.")
-            return
 
         answer = QMessageBox.question(
             self,
@@ -456,18 +613,14 @@ class MainWindow(QMainWindow):
         self._refresh_env_status()
 
     def _create_ffmpeg_install_bat(self) -> Path:
+        import tempfile
+
+        if self._ffmpeg_bat_path and self._ffmpeg_bat_path.exists():
+            return self._ffmpeg_bat_path
+
         bat_path = Path(tempfile.gettempdir()) / "mediaporter_install_ffmpeg.bat"
-        script = (
-            "@echo off\n"
-            "title MediaPorter FFmpeg Installer\n"
-            "winget install --id Gyan.FFmpeg -e --source winget --verbose "
-            "--accept-package-agreements --accept-source-agreements\n"
-            "echo.\n"
-            "echo Installation command finished.\n"
-            "echo Please close this window and return to MediaPorter.\n"
-            "pause\n"
-        )
-        bat_path.write_text(script, encoding="ascii")
+        bat_path.write_bytes(FFMPEG_INSTALL_SCRIPT)
+        self._ffmpeg_bat_path = bat_path
         return bat_path
 
     def _launch_visible_terminal(self, bat_path: Path) -> bool:
@@ -478,22 +631,9 @@ class MainWindow(QMainWindow):
         except Exception:
             return False
 
-    def stop_install_ffmpeg(self, checked: bool = False) -> None:
-        del checked
-        if not self.install_process or self.install_process.state() == QProcess.NotRunning:
-            return
-        answer = QMessageBox.question(
-            self,
-            APP_NAME,
-            "Stop the running FFmpeg installer?",
-        )
-        if answer == QMessageBox.Yes:
-            self._stop_install_process()
-            self._refresh_env_status()
-
     def open_bilibili_login(self, checked: bool = False) -> None:
         del checked
-        if self.thread and self.thread.isRunning():
+        if self.worker is not None:
             QMessageBox.information(self, APP_NAME, "Please wait until current download tasks finish.")
             return
 
@@ -514,8 +654,8 @@ class MainWindow(QMainWindow):
         dialog.resize(380, 480)
         layout = QVBoxLayout(dialog)
         qr_label = QLabel()
-        qr_label.setScaledContents(True)
-        qr_label.setFixedSize(320, 320)
+        # No scaled contents: the pixmap is already an integer multiple of the module grid.
+        qr_label.setFixedSize(QR_IMAGE_SIZE, QR_IMAGE_SIZE)
         qr_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(qr_label, alignment=Qt.AlignCenter)
 
@@ -535,8 +675,6 @@ class MainWindow(QMainWindow):
         self._qr_image_label = qr_label
         self._qr_status_label = status_label
         self._qr_countdown_label = countdown_label
-        self.qr_remaining_seconds = 180
-        self.qr_poll_tick = 0
 
         if not self._refresh_qr_code():
             self.qr_login_dialog = None
@@ -546,10 +684,11 @@ class MainWindow(QMainWindow):
             self._qr_countdown_label = None
             return
 
-        self.qr_login_timer.start()
+        self.qr_poll_timer.start()
+        self.qr_countdown_timer.start()
 
         result = dialog.exec()
-        self.qr_login_timer.stop()
+        self._stop_qr_timers()
         if result == QDialog.Accepted:
             self._finish_qr_login()
         else:
@@ -560,23 +699,27 @@ class MainWindow(QMainWindow):
         self._qr_status_label = None
         self._qr_countdown_label = None
 
-    def _poll_qr_login(self) -> None:
-        if not self.qr_login_client or not self.qr_login_key or not self.qr_login_dialog:
-            self.qr_login_timer.stop()
+    def _tick_qr_countdown(self) -> None:
+        if not self.qr_login_dialog or not self.qr_login_dialog.isVisible():
             return
-        self.qr_remaining_seconds -= 1
-        self.qr_poll_tick += 1
+        remaining = self._qr_remaining_seconds()
         if self._qr_countdown_label:
-            self._qr_countdown_label.setText(f"QR refresh in {max(0, self.qr_remaining_seconds)}s")
-        if self.qr_remaining_seconds <= 0:
-            self._refresh_qr_code()
+            self._qr_countdown_label.setText(f"QR refresh in {remaining}s")
+        if remaining <= 0 and not self._refresh_qr_code():
+            self._stop_qr_timers()
+            self.qr_login_dialog.reject()
+            return
+        self.qr_countdown_timer.start()
+
+    def _do_qr_network_poll(self) -> None:
+        if not self.qr_login_client or not self.qr_login_key or not self.qr_login_dialog:
             return
-        if self.qr_poll_tick % 2 != 0:
+        if not self.qr_login_dialog.isVisible():
             return
         try:
             status, message, confirm_url = self.qr_login_client.poll(self.qr_login_key)
         except QrLoginError as exc:
-            self.qr_login_timer.stop()
+            self._stop_qr_timers()
             QMessageBox.warning(self, APP_NAME, f"QR poll failed: {exc}")
             self.qr_login_dialog.reject()
             return
@@ -584,47 +727,74 @@ class MainWindow(QMainWindow):
         if self._qr_status_label:
             self._qr_status_label.setText(message)
         if status in ("waiting_scan", "waiting_confirm"):
+            self.qr_poll_timer.start()
             return
         if status == "success" and confirm_url:
             self.qr_confirm_url = confirm_url
-            self.qr_login_timer.stop()
+            self._stop_qr_timers()
             self.qr_login_dialog.accept()
             return
-        if status == "expired":
-            self._refresh_qr_code()
+        if status == "expired" and self._refresh_qr_code():
+            self.qr_poll_timer.start()
             return
 
-        self.qr_login_timer.stop()
+        self._stop_qr_timers()
         QMessageBox.warning(self, APP_NAME, message)
         self.qr_login_dialog.reject()
 
+    def _qr_remaining_seconds(self) -> int:
+        return max(0, int(self._qr_deadline - time.monotonic()))
+
+    def _stop_qr_timers(self) -> None:
+        self.qr_poll_timer.stop()
+        self.qr_countdown_timer.stop()
+
     def _refresh_qr_code(self) -> bool:
         if not self.qr_login_client:
             return False
         try:
-            import qrcode
-            from PIL.ImageQt import ImageQt
-            from PySide6.QtGui import QPixmap
-
             qr_url, qr_key = self.qr_login_client.generate_qr()
-            qr_img = qrcode.make(qr_url).convert("RGB")
-            qr_pix = QPixmap.fromImage(ImageQt(qr_img))
+            qr_pix = self._render_qr_pixmap(qr_url)
         except Exception as exc:
             QMessageBox.warning(self, APP_NAME, f"Failed to refresh QR code: {exc}")
             return False
 
         self.qr_login_key = qr_key
-        self.qr_remaining_seconds = 180
-        self.qr_poll_tick = 0
+        self._qr_deadline = time.monotonic() + QR_LIFETIME_SECONDS
         if self._qr_image_label:
             self._qr_image_label.setPixmap(qr_pix)
         if self._qr_countdown_label:
-            self._qr_countdown_label.setText("QR refresh in 180s")
+            self._qr_countdown_label.setText(f"QR refresh in {QR_LIFETIME_SECONDS}s")
         if self._qr_status_label:
             self._qr_status_label.setText("Use Bilibili mobile app to scan QR and confirm login.")
         self._append_log("QR code refreshed.")
         return True
 
+    def _render_qr_pixmap(self, qr_url: str) -> QPixmap:
+        import qrcode
+
+        if self._qr_factory is None:
+            self._qr_factory = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L, border=4)
+        qr = self._qr_factory
+        qr.clear()
+        qr.add_data(qr_url)
+        qr.make(fit=True)
+
+        # Rasterize the module matrix straight into a QImage (one pixel per
+        # module) instead of going through a PIL image and ImageQt.
+        matrix = qr.get_matrix()
+        size = len(matrix)
+        pixels = bytes(0 if dark else 255 for row in matrix for dark in row)
+        image = QImage(pixels, size, size, size, QImage.Format_Grayscale8)
+        # Whole-number scaling keeps every module the same width, which phone scanners rely on.
+        scaled_size = size * max(1, QR_IMAGE_SIZE // size)
+        return QPixmap.fromImage(image).scaled(
+            scaled_size,
+            scaled_size,
+            Qt.IgnoreAspectRatio,
+            Qt.FastTransformation,
+        )
+
     def _finish_qr_login(self) -> None:
         if not self.qr_login_client or not self.qr_confirm_url:
             return
@@ -649,27 +819,18 @@ class MainWindow(QMainWindow):
 
     def check_login_status(self, checked: bool = False) -> None:
         del checked
-        if self.thread and self.thread.isRunning():
+        if self.worker is not None:
             QMessageBox.information(self, APP_NAME, "Please wait until current download tasks finish.")
             return
 
-        cookie_source = self.cookie_source_combo.currentData()
-        browser_name = self.browser_combo.currentData()
-        cookie_file = Path(self.cookie_file_input.text().strip()) if self.cookie_file_input.text().strip() else None
-
-        if cookie_source == "file" and cookie_file is None:
+        ui = self._read_ui_inputs()
+        if ui.cookie_source == "file" and ui.cookie_file is None:
             QMessageBox.warning(self, APP_NAME, "Please choose a cookie file first.")
             return
 
-        downloader = MediaDownloader(
-            output_dir=Path(self.output_dir.text().strip() or str(DEFAULT_DOWNLOAD_DIR)),
-            mode=self.mode_combo.currentData(),
-            video_quality=self.quality_combo.currentData(),
-            cookie_source=cookie_source,
-            browser_name=browser_name,
-            cookie_file=cookie_file,
-            logger=self._append_log,
-        )
+        # A login made in the browser changes no UI input; drop metadata probed under the old one.
+        clear_probe_info_cache()
+        downloader = self._get_downloader(ui)
         self._append_log("Running login/VIP diagnosis...")
         report = downloader.diagnose_login()
         self.message_detail.setPlainText(report)
@@ -678,7 +839,7 @@ class MainWindow(QMainWindow):
 
     def diagnose_formats(self, checked: bool = False) -> None:
         del checked  # Qt clicked(bool) compatibility.
-        if self.thread and self.thread.isRunning():
+        if self.worker is not None:
             QMessageBox.information(self, APP_NAME, "Please wait until current download tasks finish.")
             return
 
@@ -688,22 +849,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, APP_NAME, f"No valid Bilibili URLs found.\n\nReason:\n{detail}")
             return
 
-        output_dir = Path(self.output_dir.text().strip() or str(DEFAULT_DOWNLOAD_DIR))
-        mode = self.mode_combo.currentData()
-        quality = self.quality_combo.currentData()
-        cookie_source = self.cookie_source_combo.currentData()
-        browser_name = self.browser_combo.currentData()
-        cookie_file = Path(self.cookie_file_input.text().strip()) if self.cookie_file_input.text().strip() else None
-
-        downloader = MediaDownloader(
-            output_dir=output_dir,
-            mode=mode,
-            video_quality=quality,
-            cookie_source=cookie_source,
-            browser_name=browser_name,
-            cookie_file=cookie_file,
-            logger=self._append_log,
-        )
+        downloader = self._get_downloader(self._read_ui_inputs())
         url = urls[0]
         self._append_log(f"Running format diagnosis for: {url}")
         report = downloader.diagnose_formats(url)
@@ -713,8 +859,45 @@ class MainWindow(QMainWindow):
         self._append_log("Format diagnosis completed. See Selected Message panel.")
         QMessageBox.information(self, APP_NAME, "Format diagnosis completed. Check 'Selected Message' panel.")
 
+    def _read_ui_inputs(self) -> UiSnapshot:
+        output_dir = self.output_dir.text().strip()
+        cookie_file = self.cookie_file_input.text().strip()
+        return UiSnapshot(
+            output_dir=Path(output_dir or str(DEFAULT_DOWNLOAD_DIR)),
+            max_retries=self.retry_spin.value(),
+            max_parallel=self.parallel_spin.value(),
+            mode=self.mode_combo.currentData(),
+            video_quality=self.quality_combo.currentData(),
+            cookie_source=self.cookie_source_combo.currentData(),
+            browser_name=self.browser_combo.currentData(),
+            cookie_file=Path(cookie_file) if cookie_file else None,
+        )
+
+    def _get_downloader(self, ui: UiSnapshot) -> MediaDownloader:
+        key = (ui.output_dir, ui.mode, ui.video_quality, ui.cookie_source, ui.browser_name, ui.cookie_file)
+        if self._downloader is None or self._downloader_key != key:
+            self._drop_cached_downloader()
+            self._downloader = MediaDownloader(
+                output_dir=ui.output_dir,
+                mode=ui.mode,
+                video_quality=ui.video_quality,
+                cookie_source=ui.cookie_source,
+                browser_name=ui.browser_name,
+                cookie_file=ui.cookie_file,
+                logger=self._append_log,
+            )
+            self._downloader_key = key
+        return self._downloader
+
+    def _drop_cached_downloader(self) -> None:
+        if self._downloader is None:
+            return
+        self._downloader.close()
+        self._downloader = None
+        self._downloader_key = None
+
     def _start_download(self, tasks_override: list[DownloadTask] | None = None) -> None:
-        if self.thread and self.thread.isRunning():
+        if self.worker is not None:
             return
 
         if tasks_override is None:
@@ -733,52 +916,43 @@ class MainWindow(QMainWindow):
             self._append_log(f"URL validation failed. Details: {detail}")
             return
 
-        output_dir = Path(self.output_dir.text().strip() or str(DEFAULT_DOWNLOAD_DIR))
-        max_retries = self.retry_spin.value()
-        mode = self.mode_combo.currentData()
-        quality = self.quality_combo.currentData()
-        cookie_source = self.cookie_source_combo.currentData()
-        browser_name = self.browser_combo.currentData()
-        cookie_file = Path(self.cookie_file_input.text().strip()) if self.cookie_file_input.text().strip() else None
-
-        if cookie_source == "file" and cookie_file is None:
+        ui = self._read_ui_inputs()
+        if ui.cookie_source == "file" and ui.cookie_file is None:
             QMessageBox.warning(self, APP_NAME, "Please choose a cookie file or switch cookie source.")
             return
 
-        self.active_mode = mode
+        self.active_mode = ui.mode
         self._reset_table(tasks)
         self._set_running_state(True)
         self._append_log(
             "Queue ready. "
-            f"{len(tasks)} task(s). mode={mode}, quality={quality}, retries={max_retries}, cookies={cookie_source}."
+            f"{len(tasks)} task(s). mode={ui.mode}, quality={ui.video_quality}, "
+            f"retries={ui.max_retries}, parallel={ui.max_parallel}, cookies={ui.cookie_source}."
         )
 
-        self.thread = QThread(self)
         self.worker = DownloadWorker(
             tasks=tasks,
-            output_dir=output_dir,
-            max_retries=max_retries,
-            mode=mode,
-            video_quality=quality,
-            cookie_source=cookie_source,
-            browser_name=browser_name,
-            cookie_file=cookie_file,
+            output_dir=ui.output_dir,
+            max_retries=ui.max_retries,
+            mode=ui.mode,
+            video_quality=ui.video_quality,
+            cookie_source=ui.cookie_source,
+            browser_name=ui.browser_name,
+            cookie_file=ui.cookie_file,
+            max_parallel=ui.max_parallel,
         )
-        self.worker.moveToThread(self.thread)
-
-        self.thread.started.connect(self.worker.run)
-        self.worker.task_started.connect(self._on_task_started)
-        self.worker.task_retry.connect(self._on_task_retry)
-        self.worker.task_progress.connect(self._on_task_progress)
-        self.worker.task_finished.connect(self._on_task_finished)
-        self.worker.log.connect(self._append_log)
-        self.worker.all_done.connect(self._on_all_done)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.finished.connect(self._on_thread_finished)
-
-        self.thread.start()
+
+        # Signals are emitted from pool threads; queue them so every table update runs on the GUI thread.
+        queued = Qt.QueuedConnection
+        self.worker.task_started.connect(self._on_task_started, queued)
+        self.worker.task_retry.connect(self._on_task_retry, queued)
+        self.worker.task_progress.connect(self._on_task_progress, queued)
+        self.worker.task_finished.connect(self._on_task_finished, queued)
+        self.worker.log.connect(self._append_log, queued)
+        self.worker.all_done.connect(self._on_all_done, queued)
+        self.worker.finished.connect(self._on_worker_finished, queued)
+
+        self.worker.run()
 
     def _collect_tasks_for_download(self) -> tuple[list[DownloadTask], list[str]]:
         editor_tasks, editor_diagnostics = self._collect_tasks_from_editor()
@@ -787,24 +961,14 @@ class MainWindow(QMainWindow):
         return parse_download_entries(self.url_input.toPlainText())
 
     def _collect_tasks_from_editor(self) -> tuple[list[DownloadTask], list[str]]:
-        lines: list[str] = []
-        for row in range(self.task_editor.rowCount()):
-            url_item = self.task_editor.item(row, 0)
-            name_item = self.task_editor.item(row, 1)
-            url = (url_item.text() if url_item else "").strip()
-            filename = (name_item.text() if name_item else "").strip()
-            if not url:
-                continue
-            lines.append(f"{url} || {filename}" if filename else url)
-        if not lines:
+        rows = self.task_model.rows()
+        if not any(url_text.strip() for url_text, _ in rows):
             return [], []
-        return parse_download_entries("\n".join(lines))
+        return parse_task_rows(rows)
 
     def _set_task_editor_rows(self, tasks: list[DownloadTask]) -> None:
-        self.task_editor.setRowCount(len(tasks))
-        for row, task in enumerate(tasks):
-            self.task_editor.setItem(row, 0, QTableWidgetItem(task.url))
-            self.task_editor.setItem(row, 1, QTableWidgetItem(task.filename or ""))
+        with _table_batch(self.task_editor):
+            self.task_model.set_rows([task.url, task.filename or ""] for task in tasks)
 
     def retry_failed_download(self) -> None:
         if not self.failed_tasks:
@@ -818,20 +982,17 @@ class MainWindow(QMainWindow):
             self.stop_button.setEnabled(False)
 
     def _reset_table(self, tasks: list[DownloadTask]) -> None:
+        self._pending_progress.clear()
         self.completed_tasks = 0
         self.total_tasks = len(tasks)
         self.current_tasks = tasks
         self.failed_tasks = []
+        self._failed_task_urls = set()
         self.progress.setValue(0)
         self.retry_failed_button.setEnabled(False)
 
-        self.table.setRowCount(len(tasks))
-        for row, task in enumerate(tasks):
-            self.table.setItem(row, 0, QTableWidgetItem(task.url))
-            self.table.setItem(row, 1, QTableWidgetItem(task.filename or "(auto)"))
-            self.table.setItem(row, 2, QTableWidgetItem("Pending"))
-            self.table.setItem(row, 3, QTableWidgetItem("0%"))
-            self.table.setItem(row, 4, QTableWidgetItem("-"))
+        with _table_batch(self.table):
+            self.results_model.set_rows([task.url, task.filename or "(auto)", "Pending", "0%", "-"] for task in tasks)
         self.message_detail.clear()
 
     def _set_running_state(self, running: bool) -> None:
@@ -847,6 +1008,7 @@ class MainWindow(QMainWindow):
         self.remove_task_row_button.setEnabled(not running)
         self.output_dir.setReadOnly(running)
         self.retry_spin.setEnabled(not running)
+        self.parallel_spin.setEnabled(not running)
         self.mode_combo.setEnabled(not running)
         self.quality_combo.setEnabled(not running and self.mode_combo.currentData() == "video")
         self.cookie_source_combo.setEnabled(not running)
@@ -862,35 +1024,43 @@ class MainWindow(QMainWindow):
             self._refresh_env_status()
 
     def _on_task_started(self, index: int, total: int, url: str) -> None:
-        self.table.item(index, 2).setText(f"Running ({index + 1}/{total})")
-        self.table.item(index, 4).setText("Starting...")
+        self.results_model.set_row_cells(index, {2: f"Running ({index + 1}/{total})", 4: "Starting..."})
         self._append_log(f"[{index + 1}/{total}] {url}")
 
     def _on_task_retry(self, index: int, retry_no: int, max_retries: int, message: str) -> None:
-        self.table.item(index, 2).setText(f"Retrying ({retry_no}/{max_retries})")
-        self.table.item(index, 3).setText("0%")
-        self.table.item(index, 4).setText(message)
+        self._pending_progress.pop(index, None)
+        self.results_model.set_row_cells(index, {2: f"Retrying ({retry_no}/{max_retries})", 3: "0%", 4: message})
 
     def _on_task_progress(self, index: int, percent: float, message: str) -> None:
-        clipped_percent = max(0.0, min(100.0, percent))
-        self.table.item(index, 3).setText(f"{clipped_percent:.1f}%")
-        if message:
-            self.table.item(index, 4).setText(message)
+        self._pending_progress[index] = (max(0.0, min(100.0, percent)), message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self) -> None:
+        pending = self._pending_progress
+        self._pending_progress = {}
+        for index, (percent, message) in pending.items():
+            cells = {3: f"{percent:.1f}%"}
+            if message:
+                cells[4] = message
+            self.results_model.set_row_cells(index, cells)
 
     def _on_task_finished(self, index: int, success: bool, output_path: str, message: str) -> None:
         self.completed_tasks += 1
+        # A buffered update must not overwrite the final status once the timer fires.
+        self._pending_progress.pop(index, None)
         task = self.current_tasks[index] if index < len(self.current_tasks) else DownloadTask(url="")
         task_url = task.url
-        self.table.item(index, 2).setText("Done" if success else "Failed")
-        self.table.item(index, 3).setText("100.0%" if success else self.table.item(index, 3).text())
         detail = message if not output_path else f"{message} | {output_path}"
-        message_item = self.table.item(index, 4)
-        message_item.setText(detail)
-        message_item.setToolTip(detail)
+        cells = {2: "Done" if success else "Failed", 4: detail}
+        if success:
+            cells[3] = "100.0%"
+        self.results_model.set_row_cells(index, cells)
         self.message_detail.setPlainText(detail)
 
-        if not success and task_url and all(t.url != task_url for t in self.failed_tasks):
+        if not success and task_url and task_url not in self._failed_task_urls:
             self.failed_tasks.append(task)
+            self._failed_task_urls.add(task_url)
 
         self._append_history(
             url=task_url,
@@ -903,6 +1073,7 @@ class MainWindow(QMainWindow):
         self.progress.setValue(overall)
 
     def _on_all_done(self, success_count: int, failure_count: int) -> None:
+        self._flush_history_rows()
         self._append_log(f"Finished. success={success_count}, failure={failure_count}")
         QMessageBox.information(
             self,
@@ -910,168 +1081,72 @@ class MainWindow(QMainWindow):
             f"All tasks completed.\nSuccess: {success_count}\nFailed: {failure_count}",
         )
 
-    def _on_thread_finished(self) -> None:
+    def _on_worker_finished(self) -> None:
         self._set_running_state(False)
+        if self.worker is not None:
+            self.worker.deleteLater()
         self.worker = None
-        self.thread = None
-        self._save_settings()
+        # A batch can leave hundreds of history rows to write; keep the disk I/O off the GUI thread.
+        self._save_settings(background=True)
 
     def _append_log(self, message: str) -> None:
-        self.log_view.appendPlainText(message)
+        self._log_buf.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        if not self._log_buf:
+            return
+        batch = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        self.log_view.appendPlainText(batch)
 
     def _append_history(self, url: str, mode: str, status: str, message: str) -> None:
         entry = {
-            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "time": time.strftime(HISTORY_TIME_FORMAT, time.localtime()),
             "mode": mode,
             "status": status,
             "url": url,
             "message": message,
         }
         self.history_entries.append(entry)
-        self.history_entries = self.history_entries[-300:]
-        self._refresh_history_table()
+        self._history_dirty = True
+        self._pending_history_rows.append([entry[key] for key in HISTORY_FIELDS])
+        if not self._history_flush_timer.isActive():
+            self._history_flush_timer.start()
+
+    def _flush_history_rows(self) -> None:
+        self._history_flush_timer.stop()
+        if not self._pending_history_rows:
+            return
+        # Newest entries are shown first: insert the batch at the top and drop
+        # whatever falls off the bottom instead of rebuilding the view.
+        rows = self._pending_history_rows[::-1][:HISTORY_DISPLAY_ENTRIES]
+        self._pending_history_rows.clear()
+        self.history_model.insert_rows(0, rows)
+        overflow = self.history_model.rowCount() - HISTORY_DISPLAY_ENTRIES
+        if overflow > 0:
+            self.history_model.removeRows(HISTORY_DISPLAY_ENTRIES, overflow)
 
     def _refresh_history_table(self) -> None:
-        display_entries = list(reversed(self.history_entries[-100:]))
-        self.history_table.setRowCount(len(display_entries))
-        for row, entry in enumerate(display_entries):
-            self.history_table.setItem(row, 0, QTableWidgetItem(entry["time"]))
-            self.history_table.setItem(row, 1, QTableWidgetItem(entry["mode"]))
-            self.history_table.setItem(row, 2, QTableWidgetItem(entry["status"]))
-            self.history_table.setItem(row, 3, QTableWidgetItem(entry["url"]))
-            self.history_table.setItem(row, 4, QTableWidgetItem(entry["message"]))
+        self._history_flush_timer.stop()
+        self._pending_history_rows.clear()
+        display_entries = list(islice(reversed(self.history_entries), HISTORY_DISPLAY_ENTRIES))
+        with _table_batch(self.history_table):
+            self.history_model.set_rows([entry[key] for key in HISTORY_FIELDS] for entry in display_entries)
 
     def _clear_history(self) -> None:
-        self.history_entries = []
+        self.history_entries.clear()
+        self._history_dirty = True
         self._refresh_history_table()
         self._save_settings()
 
-    def _on_table_current_cell_changed(
-        self,
-        current_row: int,
-        current_column: int,
-        previous_row: int,
-        previous_column: int,
-    ) -> None:
-        del current_column, previous_row, previous_column
+    def _on_table_current_changed(self) -> None:
+        current_row = self.table.currentIndex().row()
         if current_row < 0:
             self.message_detail.clear()
             return
-        item = self.table.item(current_row, 4)
-        self.message_detail.setPlainText(item.text() if item else "")
-
-    def _on_install_ffmpeg_output(self) -> None:
-        if not self.install_process:
-            return
-        stdout_chunk = bytes(self.install_process.readAllStandardOutput()).decode("utf-8", errors="ignore")
-        stderr_chunk = bytes(self.install_process.readAllStandardError()).decode("utf-8", errors="ignore")
-        chunk = stdout_chunk + stderr_chunk
-        if not chunk:
-            return
-        self._install_last_output_ts = time.monotonic()
-        self._install_stall_warned = False
-        self._log_install_progress_from_line(chunk)
-
-        # winget often uses carriage-return redraw; normalize to line breaks.
-        normalized = chunk.replace("\r", "\n")
-        self._install_log_buffer += normalized
-        lines = self._install_log_buffer.split("\n")
-        self._install_log_buffer = lines[-1]
-
-        for line in lines[:-1]:
-            cleaned = line.strip()
-            if cleaned:
-                self._append_log(f"[ffmpeg-install] {cleaned}")
-            self._log_install_progress_from_line(cleaned)
-
-    def _on_install_ffmpeg_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
-        del exit_status
-        self.install_watchdog.stop()
-        if self._install_log_buffer.strip():
-            tail = self._install_log_buffer.strip()
-            self._append_log(f"[ffmpeg-install] {tail}")
-            self._log_install_progress_from_line(tail)
-        self._install_log_buffer = ""
-        self._install_last_percent = -1
-        self._install_last_ratio_text = ""
-        self._install_last_output_ts = 0.0
-        self._install_stall_warned = False
-        self._refresh_env_status()
-        if exit_code == 0 and self.ffmpeg_available:
-            QMessageBox.information(self, APP_NAME, "FFmpeg installation completed successfully.")
-            self._append_log("FFmpeg installation completed successfully.")
-        else:
-            QMessageBox.warning(
-                self,
-                APP_NAME,
-                "FFmpeg installation did not complete successfully. "
-                "Please try manual install: winget install --id Gyan.FFmpeg -e",
-            )
-            self._append_log("FFmpeg installation failed or FFmpeg still not detected.")
-        self.install_process = None
-
-    def _log_install_progress_from_line(self, line: str) -> None:
-        if not line:
-            return
-        matches = re.findall(r"(\d{1,3})\s*%", line)
-        if matches:
-            percent = int(matches[-1])
-            if percent != self._install_last_percent:
-                self._install_last_percent = percent
-                self._append_log(f"[ffmpeg-install] progress: {percent}%")
-            return
-
-        ratio_match = re.search(
-            r"([0-9]+(?:\.[0-9]+)?)\s*(KB|MB|GB)\s*/\s*([0-9]+(?:\.[0-9]+)?)\s*(KB|MB|GB)",
-            line,
-            re.IGNORECASE,
-        )
-        if not ratio_match:
-            return
-        current = self._to_mb(float(ratio_match.group(1)), ratio_match.group(2).upper())
-        total = self._to_mb(float(ratio_match.group(3)), ratio_match.group(4).upper())
-        if total <= 0:
-            return
-        percent = int((current / total) * 100)
-        ratio_text = f"{current:.2f}MB/{total:.2f}MB"
-        if percent == self._install_last_percent and ratio_text == self._install_last_ratio_text:
-            return
-        self._install_last_percent = percent
-        self._install_last_ratio_text = ratio_text
-        self._append_log(f"[ffmpeg-install] progress: {percent}% ({ratio_text})")
-
-    @staticmethod
-    def _to_mb(value: float, unit: str) -> float:
-        if unit == "GB":
-            return value * 1024
-        if unit == "KB":
-            return value / 1024
-        return value
-
-    def _stop_install_process(self) -> None:
-        if not self.install_process or self.install_process.state() == QProcess.NotRunning:
-            return
-        self.install_watchdog.stop()
-        self._append_log("Stopping FFmpeg installer process...")
-        self.install_process.terminate()
-        if not self.install_process.waitForFinished(3000):
-            self.install_process.kill()
-            self.install_process.waitForFinished(2000)
-
-    def _check_install_stall(self) -> None:
-        if not self.install_process or self.install_process.state() == QProcess.NotRunning:
-            self.install_watchdog.stop()
-            return
-        if self._install_stall_warned:
-            return
-        idle_seconds = time.monotonic() - self._install_last_output_ts
-        if idle_seconds < 45:
-            return
-        self._install_stall_warned = True
-        self._append_log(
-            "[ffmpeg-install] no output for 45s, installer may be stuck. "
-            "Click 'Stop Installer' and retry, or run manual winget install."
-        )
+        self.message_detail.setPlainText(self.results_model.cell(current_row, 4))
 
     @staticmethod
     def _set_combo_by_data(combo: QComboBox, target: str, fallback: str) -> None:
@@ -1,3 +1,4 @@
+import random
 from dataclasses import dataclass
 from typing import Literal, Optional
 
@@ -14,6 +15,8 @@ class DownloadResult:
     message: str
     mode: DownloadMode = "audio"
     output_path: Optional[str] = None
+    # False when another attempt cannot help (DRM, VIP-only, login required).
+    retriable: bool = True
 
 
 @dataclass(slots=True)
@@ -26,3 +29,15 @@ class ProgressUpdate:
 class DownloadTask:
     url: str
     filename: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    base: float = 1.0
+    cap: float = 30.0
+    factor: float = 2.0
+
+    def delay_seconds(self, retry_no: int) -> float:
+        # Exponential backoff with +/-50% jitter so parallel retries do not hit Bilibili in lockstep.
+        delay = min(self.cap, self.base * self.factor ** max(0, retry_no - 1))
+        return delay * random.uniform(0.5, 1.5)
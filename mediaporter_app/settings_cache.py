@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from PySide6.QtCore import QRunnable, QSettings, QThreadPool
+
+_REMOVED = object()
+
+
+@dataclass(slots=True)
+class _ArrayScope:
+    prefix: str
+    size: int
+    writing: bool
+    index: int | None = None
+
+
+class CachedSettings:
+    """In-memory view over QSettings: read the store once, write only real changes."""
+
+    def __init__(self, settings: QSettings) -> None:
+        self._settings = settings
+        self._cache: dict[str, Any] = {key: settings.value(key) for key in settings.allKeys()}
+        self._arrays: list[_ArrayScope] = []
+        # Pending writes in call order; _REMOVED marks a removed key or group.
+        self._ops: list[tuple[str, Any]] = []
+        self._dirty = False
+        # One thread keeps background flushes in submission order.
+        self._sync_pool = QThreadPool()
+        self._sync_pool.setMaxThreadCount(1)
+
+    def value(self, key: str, default: Any = None, type: type | None = None) -> Any:  # noqa: A002 - QSettings API
+        full_key = self._full_key(key)
+        if full_key not in self._cache:
+            return default
+        raw = self._cache[full_key]
+        if type is None or raw is None:
+            return raw if raw is not None else default
+        return _coerce(raw, type, default)
+
+    def setValue(self, key: str, value: Any) -> None:  # noqa: N802 - QSettings API
+        self._set_full(self._full_key(key), value)
+
+    def remove(self, key: str) -> None:
+        self._remove_full(self._full_key(key))
+
+    # Array entries use QSettings' own layout ("prefix/<n>/key" plus
+    # "prefix/size"), so values stay compatible with QSettings.beginReadArray.
+    def beginReadArray(self, prefix: str) -> int:  # noqa: N802 - QSettings API
+        size = max(0, self.value(f"{prefix}/size", 0, type=int))
+        self._arrays.append(_ArrayScope(prefix=self._full_key(prefix), size=size, writing=False))
+        return size
+
+    def beginWriteArray(self, prefix: str, size: int = -1) -> None:  # noqa: N802 - QSettings API
+        self._arrays.append(_ArrayScope(prefix=self._full_key(prefix), size=size, writing=True))
+
+    def setArrayIndex(self, index: int) -> None:  # noqa: N802 - QSettings API
+        scope = self._arrays[-1]
+        scope.index = index
+        if scope.writing and index >= scope.size:
+            scope.size = index + 1
+
+    def endArray(self) -> None:  # noqa: N802 - QSettings API
+        scope = self._arrays.pop()
+        if not scope.writing:
+            return
+        size = max(0, scope.size)
+        previous = max(0, _coerce(self._cache.get(f"{scope.prefix}/size", 0), int, 0))
+        for index in range(size, previous):
+            self._remove_full(f"{scope.prefix}/{index + 1}")
+        self._set_full(f"{scope.prefix}/size", size)
+
+    def sync(self) -> None:
+        self._sync_pool.waitForDone()
+        if not self._dirty:
+            return
+        _apply_ops(self._settings, self._take_ops())
+        self._settings.sync()
+
+    def sync_in_background(self) -> None:
+        """Write pending changes to disk on a worker thread, using a separate QSettings handle."""
+        if not self._dirty:
+            return
+        self._sync_pool.start(_SyncRunnable(self._settings.fileName(), self._settings.format(), self._take_ops()))
+
+    def _take_ops(self) -> list[tuple[str, Any]]:
+        ops = self._ops
+        self._ops = []
+        self._dirty = False
+        return ops
+
+    def _set_full(self, full_key: str, value: Any) -> None:
+        if full_key in self._cache and self._cache[full_key] == value:
+            return
+        self._cache[full_key] = value
+        self._ops.append((full_key, value))
+        self._dirty = True
+
+    def _remove_full(self, full_key: str) -> None:
+        stale = [name for name in self._cache if name == full_key or name.startswith(f"{full_key}/")]
+        if not stale:
+            return
+        for name in stale:
+            del self._cache[name]
+        self._ops.append((full_key, _REMOVED))
+        self._dirty = True
+
+    def _full_key(self, key: str) -> str:
+        if not self._arrays:
+            return key
+        scope = self._arrays[-1]
+        if scope.index is None:
+            return f"{scope.prefix}/{key}"
+        return f"{scope.prefix}/{scope.index + 1}/{key}"
+
+
+class _SyncRunnable(QRunnable):
+    def __init__(self, file_name: str, settings_format: QSettings.Format, ops: list[tuple[str, Any]]) -> None:
+        super().__init__()
+        self.file_name = file_name
+        self.settings_format = settings_format
+        self.ops = ops
+
+    def run(self) -> None:
+        # QSettings is reentrant, so a handle owned by this thread may target the same store.
+        settings = QSettings(self.file_name, self.settings_format)
+        _apply_ops(settings, self.ops)
+        settings.sync()
+
+
+def _apply_ops(settings: QSettings, ops: list[tuple[str, Any]]) -> None:
+    for key, value in ops:
+        if value is _REMOVED:
+            settings.remove(key)
+        else:
+            settings.setValue(key, value)
+
+
+def _coerce(raw: Any, target: type, default: Any) -> Any:
+    if isinstance(raw, target):
+        return raw
+    try:
+        if target is bool:
+            return str(raw).strip().lower() in ("1", "true", "yes", "on")
+        return target(raw)
+    except (TypeError, ValueError):
+        return default
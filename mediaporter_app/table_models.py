@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+# Answers every role the painter needs in one data() call (see SpeedUpDelegate).
+MULTIPLE_ROLES_ROLE = Qt.UserRole + 1
+
+
+class RowTableModel(QAbstractTableModel):
+    """Table model over plain string rows; cells are rendered on demand by the view."""
+
+    def __init__(
+        self,
+        headers: Sequence[str],
+        editable_columns: Iterable[int] = (),
+        tooltip_columns: Iterable[int] = (),
+        parent: Any = None,
+    ) -> None:
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._editable_columns = frozenset(editable_columns)
+        self._tooltip_columns = frozenset(tooltip_columns)
+        self._rows: list[list[str]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt naming convention
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt naming convention
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[index.row()][index.column()]
+        if role == MULTIPLE_ROLES_ROLE:
+            return {Qt.DisplayRole: self._rows[index.row()][index.column()]}
+        if role == Qt.ToolTipRole and index.column() in self._tooltip_columns:
+            return self._rows[index.row()][index.column()] or None
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:  # noqa: N802
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super().flags(index)
+        if index.isValid() and index.column() in self._editable_columns:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:  # noqa: N802
+        if not index.isValid() or role != Qt.EditRole or index.column() not in self._editable_columns:
+            return False
+        self.set_cell(index.row(), index.column(), "" if value is None else str(value))
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:  # noqa: N802
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._rows[row : row + count]
+        self.endRemoveRows()
+        return True
+
+    def set_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        new_rows = [list(row) for row in rows]
+        if new_rows and len(new_rows) == len(self._rows):
+            # Same shape: update cells in place so views keep selection and scroll position.
+            self._rows = new_rows
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(new_rows) - 1, len(self._headers) - 1),
+                [Qt.DisplayRole, Qt.EditRole],
+            )
+            return
+        self.beginResetModel()
+        self._rows = new_rows
+        self.endResetModel()
+
+    def append_row(self, row: Sequence[str]) -> None:
+        self.insert_row(len(self._rows), row)
+
+    def insert_row(self, position: int, row: Sequence[str]) -> None:
+        self.insert_rows(position, [row])
+
+    def insert_rows(self, position: int, rows: Sequence[Sequence[str]]) -> None:
+        if not rows:
+            return
+        position = max(0, min(position, len(self._rows)))
+        self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+        self._rows[position:position] = [list(row) for row in rows]
+        self.endInsertRows()
+
+    def cell(self, row: int, column: int) -> str:
+        if 0 <= row < len(self._rows):
+            return self._rows[row][column]
+        return ""
+
+    def set_cell(self, row: int, column: int, text: str) -> None:
+        self.set_row_cells(row, {column: text})
+
+    def set_row_cells(self, row: int, cells: dict[int, str]) -> None:
+        """Update several cells of one row with a single dataChanged over the touched columns."""
+        if not 0 <= row < len(self._rows):
+            return
+        values = self._rows[row]
+        changed = [column for column, text in cells.items() if values[column] != text]
+        if not changed:
+            return
+        for column in changed:
+            values[column] = cells[column]
+        self.dataChanged.emit(
+            self.index(row, min(changed)),
+            self.index(row, max(changed)),
+            [Qt.DisplayRole, Qt.EditRole],
+        )
+
+    def rows(self) -> list[list[str]]:
+        return self._rows
+
+
+class SpeedUpDelegate(QStyledItemDelegate):
+    """Fill the paint options from one MULTIPLE_ROLES_ROLE query instead of one query per role."""
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex) -> None:  # noqa: N802
+        roles = index.data(MULTIPLE_ROLES_ROLE)
+        if not isinstance(roles, dict):
+            super().initStyleOption(option, index)
+            return
+        option.index = index
+        text = roles.get(Qt.DisplayRole)
+        if text:
+            option.features |= QStyleOptionViewItem.HasDisplay
+            option.text = text
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QTimer
+
+
+class SignalThrottler(QObject):
+    """Coalesce bursts of calls into one trailing call with the latest arguments."""
+
+    def __init__(self, callback: Callable[..., Any], timeout_ms: int, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._callback = callback
+        self._pending_args: tuple | None = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max(0, timeout_ms))
+        self._timer.timeout.connect(self._emit)
+
+    def __call__(self, *args: Any) -> None:
+        self._pending_args = args
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        self._timer.stop()
+        self._emit()
+
+    def cancel(self) -> None:
+        self._timer.stop()
+        self._pending_args = None
+
+    def _emit(self) -> None:
+        args, self._pending_args = self._pending_args, None
+        if args is not None:
+            self._callback(*args)
+
+
+def qthrottled(callback: Callable[..., Any], timeout_ms: int, parent: QObject | None = None) -> SignalThrottler:
+    return SignalThrottler(callback, timeout_ms, parent)
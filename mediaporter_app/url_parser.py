@@ -1,6 +1,7 @@
 import re
+from functools import lru_cache
 from typing import Iterable
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from .models import DownloadTask
 
@@ -22,43 +23,37 @@ BILIBILI_PATH_PREFIXES = (
 )
 LEADING_TRIM_CHARS = "\"'([{<\u3010\u300a\u300c\u300e"
 TRAILING_TRIM_CHARS = "\"').,!?;:]>\u3011\u300b\u300d\u300f\uff0c\u3002\uff01\uff1f\uff1b\uff1a"
+FULLWIDTH_URL_CHARS = str.maketrans(
+    {
+        "\uff1a": ":",
+        "\uff0f": "/",
+        "\uff0e": ".",
+        "\uff1f": "?",
+        "\uff06": "&",
+    }
+)
 
 
 def extract_urls(text: str) -> list[str]:
     if not text:
         return []
     normalized_text = _normalize_input_text(text)
-    return [_normalize_url_candidate(candidate) for candidate in URL_PATTERN.findall(normalized_text)]
+    if "://" not in normalized_text:
+        # Plain prose: one C-level substring scan instead of trying the pattern at every offset.
+        return []
+    # Matches start with "http" and contain no whitespace, so only the tail can need trimming.
+    return [candidate.rstrip(TRAILING_TRIM_CHARS) for candidate in URL_PATTERN.findall(normalized_text)]
 
 
+@lru_cache(maxsize=4096)
 def is_supported_url(url: str) -> bool:
-    normalized = _normalize_url_candidate(url)
-    parsed = urlparse(normalized)
-    host = parsed.netloc.lower()
-    if host.startswith("www."):
-        host = host[4:]
-
-    if host == "b23.tv":
-        return True
-
-    if not host.endswith("bilibili.com"):
-        return False
-
-    path = parsed.path.lower()
-    return any(path.startswith(prefix) for prefix in BILIBILI_PATH_PREFIXES)
+    return _unsupported_reason(_normalize_url_candidate(url)) is None
 
 
 def filter_supported_urls(urls: Iterable[str]) -> list[str]:
-    seen: set[str] = set()
-    valid_urls: list[str] = []
-    for raw_url in urls:
-        url = _normalize_url_candidate(raw_url)
-        if not url or url in seen:
-            continue
-        if is_supported_url(url):
-            valid_urls.append(url)
-            seen.add(url)
-    return valid_urls
+    candidates = (_normalize_url_candidate(raw_url) for raw_url in urls)
+    # dict keys deduplicate while keeping first-seen order; repeats hit is_supported_url's cache.
+    return list(dict.fromkeys(url for url in candidates if url and is_supported_url(url)))
 
 
 def diagnose_urls(text: str) -> tuple[list[str], list[str]]:
@@ -97,24 +92,49 @@ def diagnose_urls(text: str) -> tuple[list[str], list[str]]:
 def parse_download_entries(text: str) -> tuple[list[DownloadTask], list[str]]:
     if not text:
         return [], ["No input."]
+    return _parse_entries(_split_entry_lines(_normalize_input_text(text)))
 
-    normalized = _normalize_input_text(text)
-    tasks: list[DownloadTask] = []
-    diagnostics: list[str] = []
-    seen: set[str] = set()
 
+def parse_task_rows(rows: Iterable[tuple[str, str]]) -> tuple[list[DownloadTask], list[str]]:
+    # Editor rows already keep URL and filename apart, so skip the "url || name" round trip.
+    return _parse_entries(_split_task_rows(rows))
+
+
+def _split_task_rows(rows: Iterable[tuple[str, str]]) -> Iterable[tuple[int, str, str]]:
+    for rowno, (url_text, filename_text) in enumerate(rows, start=1):
+        left = _normalize_input_text(url_text.strip())
+        if not left:
+            continue
+        right = _normalize_input_text(filename_text)
+        if "||" in left:
+            # Same result as the joined "url || name" line: its first "||" wins.
+            left, rest = left.split("||", 1)
+            right = f"{rest} || {right}" if right.strip() else rest
+        yield rowno, left, right
+
+
+def _split_entry_lines(normalized: str) -> Iterable[tuple[int, str, str]]:
     for lineno, raw_line in enumerate(normalized.splitlines(), start=1):
         line = raw_line.strip()
         if not line:
             continue
-
         left, right = (line.split("||", 1) + [""])[:2] if "||" in line else (line, "")
-        candidates = extract_urls(left)
-        if not candidates:
+        yield lineno, left, right
+
+
+def _parse_entries(entries: Iterable[tuple[int, str, str]]) -> tuple[list[DownloadTask], list[str]]:
+    tasks: list[DownloadTask] = []
+    diagnostics: list[str] = []
+    seen: set[str] = set()
+
+    for lineno, left, right in entries:
+        # Input is already normalized; only the first URL on a line matters.
+        match = URL_PATTERN.search(left) if "://" in left else None
+        if not match:
             diagnostics.append(f"Line {lineno}: no URL found.")
             continue
 
-        url = _normalize_url_candidate(candidates[0])
+        url = match.group(0).rstrip(TRAILING_TRIM_CHARS)
         if url in seen:
             diagnostics.append(f"Line {lineno}: duplicate ignored ({url}).")
             continue
@@ -132,11 +152,11 @@ def parse_download_entries(text: str) -> tuple[list[DownloadTask], list[str]]:
     return tasks, diagnostics
 
 
+@lru_cache(maxsize=4096)
 def _unsupported_reason(url: str) -> str | None:
-    parsed = urlparse(url)
-    host = parsed.netloc.lower()
-    if host.startswith("www."):
-        host = host[4:]
+    # urlsplit skips urlparse's ";params" pass; hostname is already lowercased and drops any port.
+    parsed = urlsplit(url)
+    host = (parsed.hostname or "").removeprefix("www.")
 
     if host == "b23.tv":
         return None
@@ -146,7 +166,7 @@ def _unsupported_reason(url: str) -> str | None:
         return f"host is not bilibili/b23 ({host})"
 
     path = parsed.path.lower()
-    if any(path.startswith(prefix) for prefix in BILIBILI_PATH_PREFIXES):
+    if path.startswith(BILIBILI_PATH_PREFIXES):
         return None
     return f"path not supported ({path or '/'})"
 
@@ -156,17 +176,7 @@ def _normalize_url_candidate(url: str) -> str:
 
 
 def _normalize_input_text(text: str) -> str:
-    replacements = {
-        "\uff1a": ":",
-        "\uff0f": "/",
-        "\uff0e": ".",
-        "\uff1f": "?",
-        "\uff06": "&",
-    }
-    normalized = text
-    for src, dst in replacements.items():
-        normalized = normalized.replace(src, dst)
-    return normalized
+    return text.translate(FULLWIDTH_URL_CHARS)
 
 
 def _normalize_filename_candidate(raw: str) -> str | None:
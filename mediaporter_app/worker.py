@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+import threading
+import time
+from functools import partial
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
 
 from .downloader import MediaDownloader
-from .models import BrowserName, CookieSource, DownloadMode, DownloadResult, DownloadTask, ProgressUpdate, VideoQuality
+from .models import (
+    BrowserName,
+    CookieSource,
+    DownloadMode,
+    DownloadResult,
+    DownloadTask,
+    ProgressUpdate,
+    RetryPolicy,
+    VideoQuality,
+)
+
+# Kept low on purpose: Bilibili starts rate-limiting well before bandwidth runs out.
+MAX_PARALLEL_DOWNLOADS = 4
+# The window repaints progress every 100 ms (gui.PROGRESS_FLUSH_INTERVAL_MS);
+# faster per-task emits would only queue events the GUI coalesces away.
+PROGRESS_EMIT_INTERVAL_SECONDS = 0.1
 
 
 class DownloadWorker(QObject):
@@ -27,6 +45,8 @@ class DownloadWorker(QObject):
         cookie_source: CookieSource = "none",
         browser_name: BrowserName = "edge",
         cookie_file: Path | None = None,
+        max_parallel: int = 1,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         super().__init__()
         self.tasks = tasks
@@ -37,14 +57,46 @@ class DownloadWorker(QObject):
         self.cookie_source = cookie_source
         self.browser_name = browser_name
         self.cookie_file = cookie_file
-        self._stopped = False
+        self.max_parallel = max(1, min(MAX_PARALLEL_DOWNLOADS, max_parallel))
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._success_count = 0
+        self._failure_count = 0
+        self._cancel_logged = False
+        # Keyed by task index; each index is only written by the thread running that task.
+        self._last_progress_emit: dict[int, float] = {}
+        # One downloader per pool thread, reused by every task that thread runs. Keyed by
+        # thread id: PySide gives each QRunnable.run() a fresh Python thread state, so
+        # threading.local() values do not survive between tasks on the same thread.
+        self._thread_downloaders: dict[int, MediaDownloader] = {}
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(self.max_parallel)
 
     @Slot()
     def run(self) -> None:
-        success_count = 0
-        failure_count = 0
+        # Tasks run on the pool; all_done/finished fire once the last one reports back.
+        self._pending = len(self.tasks)
+        if not self.tasks:
+            self._emit_done()
+            return
+        for index, task in enumerate(self.tasks):
+            self.pool.start(DownloadRunnable(self, index, task))
+
+    @Slot()
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def is_stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def wait_before_retry(self, seconds: float) -> bool:
+        # Returns True when stop() interrupted the wait.
+        return self._stop_event.wait(seconds)
 
-        downloader = MediaDownloader(
+    def create_downloader(self) -> MediaDownloader:
+        return MediaDownloader(
             output_dir=self.output_dir,
             mode=self.mode,
             video_quality=self.video_quality,
@@ -53,58 +105,116 @@ class DownloadWorker(QObject):
             cookie_file=self.cookie_file,
             logger=self.log.emit,
         )
-        total = len(self.tasks)
 
-        for index, task in enumerate(self.tasks):
-            url = task.url
-            if self._stopped:
-                self.log.emit("Download canceled by user.")
-                break
+    def thread_downloader(self) -> MediaDownloader:
+        # YoutubeDL instances are not thread-safe, but a thread may reuse its own
+        # (and its loaded extractors, cookies and open connections) across URLs.
+        thread_id = threading.get_ident()
+        with self._lock:
+            downloader = self._thread_downloaders.get(thread_id)
+        if downloader is None:
+            downloader = self.create_downloader()
+            with self._lock:
+                self._thread_downloaders[thread_id] = downloader
+        return downloader
+
+    def report_canceled(self) -> None:
+        with self._lock:
+            if self._cancel_logged:
+                return
+            self._cancel_logged = True
+        self.log.emit("Download canceled by user.")
+
+    def report_task_done(self, success: bool | None) -> None:
+        with self._lock:
+            if success is True:
+                self._success_count += 1
+            elif success is False:
+                self._failure_count += 1
+            self._pending -= 1
+            last = self._pending == 0
+        if last:
+            self._close_downloaders()
+            self._emit_done()
+
+    def on_progress(self, index: int, progress: ProgressUpdate) -> None:
+        now = time.monotonic()
+        last = self._last_progress_emit.get(index, float("-inf"))
+        if progress.percent < 100.0 and now - last < PROGRESS_EMIT_INTERVAL_SECONDS:
+            return
+        self._last_progress_emit[index] = now
+        self.task_progress.emit(index, progress.percent, progress.message)
 
-            self.task_started.emit(index, total, url)
-            result: DownloadResult | None = None
+    def _close_downloaders(self) -> None:
+        # Runs after the last task reported back, so no thread is still using one.
+        with self._lock:
+            downloaders = list(self._thread_downloaders.values())
+            self._thread_downloaders.clear()
+        for downloader in downloaders:
+            downloader.close()
 
-            for attempt in range(1, self.max_retries + 2):
-                if self._stopped:
-                    break
+    def _emit_done(self) -> None:
+        self.all_done.emit(self._success_count, self._failure_count)
+        self.finished.emit()
 
-                if attempt > 1:
-                    retry_no = attempt - 1
-                    retry_message = f"Retrying ({retry_no}/{self.max_retries})"
-                    self.task_retry.emit(index, retry_no, self.max_retries, retry_message)
-                    self.log.emit(f"[{index + 1}/{total}] {retry_message}: {url}")
-
-                result = downloader.download_with_filename(
-                    url=url,
-                    filename=task.filename,
-                    progress_callback=lambda progress, idx=index: self._on_progress(idx, progress),
-                )
-                if result.success:
-                    break
 
-                self.log.emit(f"[{index + 1}/{total}] Attempt {attempt} failed: {result.message}")
+class DownloadRunnable(QRunnable):
+    def __init__(self, worker: DownloadWorker, index: int, task: DownloadTask) -> None:
+        super().__init__()
+        self.worker = worker
+        self.index = index
+        self.task = task
 
-            if self._stopped:
-                self.log.emit("Download canceled by user.")
+    def run(self) -> None:
+        success: bool | None = None
+        try:
+            success = self._download()
+        finally:
+            self.worker.report_task_done(success)
+
+    def _download(self) -> bool | None:
+        worker = self.worker
+        index = self.index
+        url = self.task.url
+        total = len(worker.tasks)
+        if worker.is_stopped():
+            worker.report_canceled()
+            return None
+
+        worker.task_started.emit(index, total, url)
+        downloader = worker.thread_downloader()
+        result: DownloadResult | None = None
+        for attempt in range(1, worker.max_retries + 2):
+            if worker.is_stopped():
                 break
 
-            if result is None:
-                result = DownloadResult(url=url, success=False, message="Task canceled before completion.")
+            if attempt > 1:
+                retry_no = attempt - 1
+                delay = worker.retry_policy.delay_seconds(retry_no)
+                retry_message = f"Retrying ({retry_no}/{worker.max_retries}) in {delay:.1f}s"
+                worker.task_retry.emit(index, retry_no, worker.max_retries, retry_message)
+                worker.log.emit(f"[{index + 1}/{total}] {retry_message}: {url}")
+                if worker.wait_before_retry(delay):
+                    break
 
+            result = downloader.download(
+                url,
+                progress_callback=partial(worker.on_progress, index),
+                filename=self.task.filename,
+            )
             if result.success:
-                success_count += 1
-            else:
-                failure_count += 1
+                break
 
-            output_path = result.output_path or ""
-            self.task_finished.emit(index, result.success, output_path, result.message)
+            worker.log.emit(f"[{index + 1}/{total}] Attempt {attempt} failed: {result.message}")
+            if not result.retriable:
+                break
 
-        self.all_done.emit(success_count, failure_count)
-        self.finished.emit()
+        if worker.is_stopped():
+            worker.report_canceled()
+            return None
 
-    @Slot()
-    def stop(self) -> None:
-        self._stopped = True
+        if result is None:
+            result = DownloadResult(url=url, success=False, message="Task canceled before completion.")
 
-    def _on_progress(self, index: int, progress: ProgressUpdate) -> None:
-        self.task_progress.emit(index, progress.percent, progress.message)
+        worker.task_finished.emit(index, result.success, result.output_path or "", result.message)
+        return result.success
@@ -1,8 +1,14 @@
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+import yt_dlp
+
+from mediaporter_app import downloader as downloader_module
 from mediaporter_app.downloader import MediaDownloader
+from mediaporter_app.models import DownloadResult, ProgressUpdate
 
 
 class DownloaderTests(unittest.TestCase):
@@ -36,6 +42,33 @@ class DownloaderTests(unittest.TestCase):
             downloader.video_quality = "auto"
             self.assertEqual(downloader._select_format(), "best[vcodec!=none][acodec!=none]")
 
+    def test_resolve_output_path_prefers_known_extensions(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            downloader = MediaDownloader(Path(temp_dir), mode="video")
+            base_path = Path(temp_dir) / "clip.webm"
+            (Path(temp_dir) / "clip.mp4").write_bytes(b"")
+            self.assertEqual(downloader._resolve_output_path(base_path), Path(temp_dir) / "clip.mp4")
+
+            (Path(temp_dir) / "clip.mp4").unlink()
+            (Path(temp_dir) / "clip.f4v").write_bytes(b"")
+            self.assertEqual(downloader._resolve_output_path(base_path), Path(temp_dir) / "clip.f4v")
+
+            (Path(temp_dir) / "clip [1].f4v").write_bytes(b"")
+            bracketed = Path(temp_dir) / "clip [1].webm"
+            self.assertEqual(downloader._resolve_output_path(bracketed), Path(temp_dir) / "clip [1].f4v")
+            self.assertIsNone(downloader._resolve_output_path(Path(temp_dir) / "missing.webm"))
+
+    def test_progress_hook_forwards_only_percent_changes(self) -> None:
+        updates = []
+        hook = MediaDownloader._build_progress_hook(updates.append)
+        ticks = [0.0, 0.1, 0.2, 0.22, 0.5]
+        with mock.patch.object(downloader_module.time, "monotonic", side_effect=ticks):
+            for downloaded in (100, 150, 250, 300, 260):
+                hook({"status": "downloading", "downloaded_bytes": downloaded, "total_bytes": 10000})
+        hook({"status": "finished"})
+        # 1.5% repeats the percent and 3.0% lands inside the rate limit; 2.6% is a timed refresh.
+        self.assertEqual([update.percent for update in updates], [1.0, 2.5, 2.6, 100.0])
+
     def test_error_mapping(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             downloader = MediaDownloader(Path(temp_dir), mode="video", video_quality="auto")
@@ -44,6 +77,12 @@ class DownloaderTests(unittest.TestCase):
             self.assertIn("Login/VIP", downloader._map_download_error("HTTP Error 403"))
             self.assertIn("updating yt-dlp", downloader._map_download_error("Unable to extract"))
             self.assertIn("WinError 10013", downloader._map_download_error("TransportError: WinError 10013"))
+            # Rule order decides, not where the marker appears in the message.
+            self.assertIn("DRM-protected", downloader._map_download_error("Login required: DRM"))
+            self.assertIn(
+                "Configure browser/file cookies",
+                downloader._map_download_error("Could not copy Chrome cookie database"),
+            )
             self.assertIn(
                 "Requested quality/format is unavailable",
                 downloader._map_download_error(
@@ -91,12 +130,150 @@ class DownloaderTests(unittest.TestCase):
         self.assertIn("id=p720", summary)
         self.assertIn("id=a128", summary)
 
+    def test_fragment_options_skip_mp3_extraction(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            downloader = MediaDownloader(Path(temp_dir), mode="video", concurrent_fragments=8)
+            opts = downloader._build_options(lambda _: None)
+            self.assertEqual(opts["concurrent_fragment_downloads"], 8)
+            self.assertEqual(opts["http_chunk_size"], downloader_module.HTTP_CHUNK_SIZE)
+
+            downloader.mode = "audio"
+            downloader.ffmpeg_available = True
+            opts = downloader._build_options(lambda _: None)
+            self.assertNotIn("concurrent_fragment_downloads", opts)
+            self.assertNotIn("http_chunk_size", opts)
+
     def test_build_probe_options_does_not_force_format(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             downloader = MediaDownloader(Path(temp_dir), mode="video", video_quality="1080")
             probe_opts = downloader._build_probe_options()
             self.assertNotIn("format", probe_opts)
             self.assertEqual(probe_opts.get("skip_download"), True)
+            self.assertNotIn("progress_hooks", probe_opts)
+
+    def test_probe_ydl_is_reused_until_login_inputs_change(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            downloader = MediaDownloader(Path(temp_dir), mode="video", video_quality="auto")
+            first = downloader._get_probe_ydl()
+            self.assertIs(downloader._get_probe_ydl(), first)
+
+            download_ydl = downloader._get_download_ydl(downloader._build_options(lambda _: None))
+            downloader.cookie_source = "file"
+            second = downloader._get_probe_ydl()
+            self.assertIsNot(second, first)
+            self.assertIn(download_ydl, downloader._download_ydls.values())
+
+            downloader.close()
+            self.assertIsNone(downloader._probe_ydl)
+
+    def test_browser_login_diagnosis_reloads_cookies(self) -> None:
+        payload = b'{"code": 0, "data": {"isLogin": true, "uname": "user", "mid": 1}}'
+        with tempfile.TemporaryDirectory() as temp_dir:
+            downloader = MediaDownloader(Path(temp_dir), cookie_source="browser", browser_name="edge")
+            with mock.patch.object(downloader_module.yt_dlp, "YoutubeDL") as ydl_class:
+                ydl_class.return_value.urlopen.return_value.__enter__.return_value.read.return_value = payload
+                downloader.diagnose_login()
+                downloader.diagnose_login()
+                # Each diagnosis builds a fresh instance, so the browser cookie store is read again.
+                self.assertEqual(ydl_class.call_count, 2)
+                self.assertEqual(ydl_class.return_value.close.call_count, 1)
+
+    def test_download_ydl_is_reused_across_formats_and_names(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with MediaDownloader(Path(temp_dir), mode="video", video_quality="auto") as downloader:
+                seen: list[ProgressUpdate] = []
+                opts = downloader._build_options(seen.append)
+                first = downloader._get_download_ydl(opts)
+
+                fallback_opts = downloader._build_options(lambda _: None)
+                fallback_opts["format"] = "best"
+                fallback_opts["outtmpl"] = str(Path(temp_dir) / "custom.%(ext)s")
+                self.assertIs(downloader._get_download_ydl(fallback_opts), first)
+                self.assertEqual(first.params["format"], "best")
+                self.assertEqual(first.params["outtmpl"]["default"], fallback_opts["outtmpl"])
+
+                downloader._get_download_ydl(opts)
+                first._progress_hooks[0]({"status": "finished"})
+                self.assertEqual(len(seen), 1)
+            self.assertEqual(downloader._download_ydls, {})
+
+    def test_preflight_metadata_is_shared_with_diagnosis(self) -> None:
+        info = {
+            "title": "clip",
+            "formats": [{"format_id": "p1", "vcodec": "avc1", "acodec": "mp4a", "height": 720, "tbr": 900}],
+        }
+        url = "https://b23.tv/shared"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            downloader = MediaDownloader(Path(temp_dir), mode="video", video_quality="auto")
+            downloader.ffmpeg_available = False
+            probe = mock.Mock()
+            probe.extract_info.return_value = info
+            with mock.patch.object(downloader, "_get_probe_ydl", return_value=probe):
+                ydl_opts: dict = {}
+                self.assertIs(downloader._apply_preflight_format_selection(url, ydl_opts), info)
+                self.assertEqual(ydl_opts["format"], "p1")
+
+            # Another downloader with the same login inputs answers from the shared cache.
+            other = MediaDownloader(Path(temp_dir), mode="video", video_quality="auto")
+            other.ffmpeg_available = False
+            with mock.patch.object(other, "_get_probe_ydl", side_effect=AssertionError("probed again")):
+                self.assertIn("Recommended selector: p1", other.diagnose_formats(url))
+            self.assertEqual(probe.extract_info.call_count, 1)
+
+            other.cookie_source = "browser"
+            self.assertNotEqual(other._probe_cache_key(url), downloader._probe_cache_key(url))
+
+            # Expired entries are probed again; failed downloads drop theirs.
+            key = downloader._probe_cache_key(url)
+            downloader_module._probe_info_cache[key] = (-downloader_module.PROBE_INFO_TTL_SECONDS, info)
+            with mock.patch.object(downloader, "_get_probe_ydl", return_value=probe):
+                downloader._probe_info(url)
+            self.assertEqual(probe.extract_info.call_count, 2)
+            downloader._forget_probe_info(url)
+            self.assertNotIn(key, downloader_module._probe_info_cache)
+
+    def test_login_change_forces_fresh_probe(self) -> None:
+        info = {"title": "clip", "formats": [{"format_id": "p1", "vcodec": "avc1", "acodec": "mp4a"}]}
+        url = "https://b23.tv/login"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cookie_file = Path(temp_dir) / "cookies.txt"
+            cookie_file.write_text("# guest\n", encoding="utf-8")
+            downloader = MediaDownloader(Path(temp_dir), mode="video", cookie_source="file", cookie_file=cookie_file)
+            probe = mock.Mock()
+            probe.extract_info.return_value = info
+            with mock.patch.object(downloader, "_get_probe_ydl", return_value=probe):
+                downloader._probe_info(url)
+                downloader._probe_info(url)
+                self.assertEqual(probe.extract_info.call_count, 1)
+
+                # QR login rewrites the same cookie file path.
+                stat = cookie_file.stat()
+                os.utime(cookie_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                downloader._probe_info(url)
+                self.assertEqual(probe.extract_info.call_count, 2)
+
+                # Browser logins change nothing in the key. Check Login/VIP clears the cache;
+                # otherwise entries probed before the login expire with the TTL.
+                downloader_module.clear_probe_info_cache()
+                downloader._probe_info(url)
+                self.assertEqual(probe.extract_info.call_count, 3)
+
+    def test_download_many_keeps_order_and_tags_progress(self) -> None:
+        def fake_download(downloader, url, progress_callback=None):
+            progress_callback(ProgressUpdate(percent=50.0, message=url))
+            return DownloadResult(url=url, success=url.endswith("ok"), message="done")
+
+        updates: list[tuple[int, str]] = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            downloader = MediaDownloader(Path(temp_dir))
+            with mock.patch.object(MediaDownloader, "download", autospec=True, side_effect=fake_download):
+                results = downloader.download_many(
+                    ["https://b23.tv/a-ok", "https://b23.tv/b-bad"],
+                    progress_callback=lambda index, progress: updates.append((index, progress.message)),
+                    max_workers=2,
+                )
+        self.assertEqual([result.success for result in results], [True, False])
+        self.assertEqual(sorted(updates), [(0, "https://b23.tv/a-ok"), (1, "https://b23.tv/b-bad")])
 
     def test_error_mapping_no_ffmpeg_video_requires_merge(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -120,6 +297,42 @@ class DownloaderTests(unittest.TestCase):
         self.assertIn("isLogin: True", report)
         self.assertIn("active VIP", report)
 
+    def test_custom_filename_survives_format_fallback(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            downloader = MediaDownloader(Path(temp_dir), mode="video", video_quality="auto")
+            templates: list[str] = []
+
+            def extract(url: str, ydl_opts: dict, info: dict | None = None) -> Path:
+                templates.append(ydl_opts["outtmpl"])
+                if len(templates) == 1:
+                    raise yt_dlp.utils.DownloadError("Requested format is not available")
+                return Path(temp_dir) / "My clip.mp4"
+
+            with mock.patch.object(downloader, "_apply_preflight_format_selection", return_value=None):
+                with mock.patch.object(downloader, "_extract_with_options", side_effect=extract):
+                    result = downloader.download("https://example.com/v", filename="My: clip")
+            self.assertTrue(result.success)
+            self.assertEqual(templates, [str(Path(temp_dir) / "My_ clip.%(ext)s")] * 2)
+
+    def test_only_unambiguous_failures_are_not_retriable(self) -> None:
+        cases = {
+            "\x1b[0;31mERROR:\x1b[0m This video is DRM protected": False,
+            "This video is for premium members only": False,
+            "Login required to access this video": False,
+            "HTTP Error 403: Forbidden": True,
+            "Unable to parse payload": True,
+            "Could not copy Chrome cookie database": True,
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            downloader = MediaDownloader(Path(temp_dir), mode="audio")
+            for message, retriable in cases.items():
+                with self.subTest(message=message):
+                    error = yt_dlp.utils.DownloadError(message)
+                    with mock.patch.object(downloader, "_extract_with_options", side_effect=error):
+                        result = downloader.download("https://example.com/v")
+                    self.assertFalse(result.success)
+                    self.assertEqual(result.retriable, retriable)
+
     def test_sanitize_filename(self) -> None:
         self.assertEqual(MediaDownloader._sanitize_filename("a:b*?<>|"), "a_b_")
 
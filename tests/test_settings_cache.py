@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from PySide6.QtCore import QSettings
+
+from mediaporter_app.settings_cache import CachedSettings
+
+
+class CachedSettingsTests(unittest.TestCase):
+    def test_reads_existing_values_with_type_coercion(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "settings.ini")
+            raw = QSettings(path, QSettings.IniFormat)
+            raw.setValue("max_retries", 3)
+            raw.setValue("download_mode", "video")
+            raw.sync()
+
+            cached = CachedSettings(QSettings(path, QSettings.IniFormat))
+            self.assertEqual(cached.value("max_retries", 1, type=int), 3)
+            self.assertEqual(cached.value("download_mode", "audio", type=str), "video")
+            self.assertEqual(cached.value("missing", "fallback", type=str), "fallback")
+
+    def test_set_value_skips_unchanged_writes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "settings.ini")
+            cached = CachedSettings(QSettings(path, QSettings.IniFormat))
+            cached.setValue("download_mode", "video")
+            cached.sync()
+            self.assertFalse(cached._dirty)
+
+            cached.setValue("download_mode", "video")
+            self.assertFalse(cached._dirty)
+
+            cached.setValue("download_mode", "audio")
+            self.assertTrue(cached._dirty)
+            cached.sync()
+            self.assertEqual(QSettings(path, QSettings.IniFormat).value("download_mode"), "audio")
+
+    def test_background_sync_writes_through_own_handle(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "settings.ini")
+            cached = CachedSettings(QSettings(path, QSettings.IniFormat))
+            cached.setValue("download_mode", "video")
+            cached.remove("missing")
+            cached.sync_in_background()
+            self.assertFalse(cached._dirty)
+            cached.sync()
+            self.assertEqual(QSettings(path, QSettings.IniFormat).value("download_mode"), "video")
+
+    def test_array_round_trip_and_shrink(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "settings.ini")
+            cached = CachedSettings(QSettings(path, QSettings.IniFormat))
+            cached.beginWriteArray("history", 3)
+            for index, url in enumerate(["a", "b", "c"]):
+                cached.setArrayIndex(index)
+                cached.setValue("url", url)
+            cached.endArray()
+            cached.sync()
+
+            raw = QSettings(path, QSettings.IniFormat)
+            size = raw.beginReadArray("history")
+            urls = []
+            for index in range(size):
+                raw.setArrayIndex(index)
+                urls.append(raw.value("url"))
+            raw.endArray()
+            self.assertEqual(urls, ["a", "b", "c"])
+
+            reloaded = CachedSettings(QSettings(path, QSettings.IniFormat))
+            reloaded.beginWriteArray("history", 1)
+            reloaded.setArrayIndex(0)
+            reloaded.setValue("url", "z")
+            reloaded.endArray()
+            self.assertEqual(reloaded.beginReadArray("history"), 1)
+            reloaded.setArrayIndex(0)
+            self.assertEqual(reloaded.value("url", "", type=str), "z")
+            reloaded.endArray()
+            reloaded.sync()
+            self.assertNotIn("history/2/url", QSettings(path, QSettings.IniFormat).allKeys())
+
+
+if __name__ == "__main__":
+    unittest.main()
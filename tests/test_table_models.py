@@ -0,0 +1,72 @@
+import unittest
+
+from PySide6.QtCore import Qt
+
+from mediaporter_app.table_models import MULTIPLE_ROLES_ROLE, RowTableModel
+
+
+class RowTableModelTests(unittest.TestCase):
+    def test_rows_and_cells(self) -> None:
+        model = RowTableModel(["URL", "Name"], tooltip_columns=(1,))
+        model.set_rows([["u1", "a"], ["u2", ""]])
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.columnCount(), 2)
+        self.assertEqual(model.headerData(0, Qt.Horizontal), "URL")
+        self.assertEqual(model.index(0, 1).data(), "a")
+        self.assertEqual(model.index(0, 1).data(Qt.ToolTipRole), "a")
+        self.assertIsNone(model.index(1, 1).data(Qt.ToolTipRole))
+        self.assertEqual(model.index(0, 0).data(MULTIPLE_ROLES_ROLE), {Qt.DisplayRole: "u1"})
+
+        model.set_cell(1, 1, "b")
+        self.assertEqual(model.cell(1, 1), "b")
+        self.assertEqual(model.cell(5, 0), "")
+
+    def test_set_row_cells_emits_one_change(self) -> None:
+        model = RowTableModel(["URL", "Status", "Progress"])
+        model.set_rows([["u1", "Pending", "0%"]])
+        changes: list[tuple[int, int]] = []
+        model.dataChanged.connect(lambda top, bottom, roles: changes.append((top.column(), bottom.column())))
+        model.set_row_cells(0, {1: "Running", 2: "5%"})
+        model.set_row_cells(0, {1: "Running"})
+        self.assertEqual(model.rows(), [["u1", "Running", "5%"]])
+        self.assertEqual(changes, [(1, 2)])
+
+    def test_only_editable_columns_accept_edits(self) -> None:
+        model = RowTableModel(["URL", "Name"], editable_columns=(1,))
+        model.append_row(["u1", ""])
+        self.assertFalse(model.setData(model.index(0, 0), "x"))
+        self.assertTrue(model.setData(model.index(0, 1), "name"))
+        self.assertTrue(model.flags(model.index(0, 1)) & Qt.ItemIsEditable)
+        self.assertEqual(model.rows(), [["u1", "name"]])
+
+    def test_remove_rows(self) -> None:
+        model = RowTableModel(["URL"])
+        model.set_rows([["a"], ["b"], ["c"], ["d"]])
+        self.assertTrue(model.removeRows(1, 2))
+        self.assertEqual(model.rows(), [["a"], ["d"]])
+        self.assertFalse(model.removeRows(1, 5))
+
+    def test_same_shape_set_rows_updates_in_place(self) -> None:
+        model = RowTableModel(["URL"])
+        model.set_rows([["a"], ["b"]])
+        resets: list[bool] = []
+        changes: list[tuple[int, int]] = []
+        model.modelReset.connect(lambda: resets.append(True))
+        model.dataChanged.connect(lambda top, bottom, roles: changes.append((top.row(), bottom.row())))
+        model.set_rows([["c"], ["d"]])
+        self.assertEqual(model.rows(), [["c"], ["d"]])
+        self.assertEqual((resets, changes), ([], [(0, 1)]))
+        model.set_rows([["e"]])
+        self.assertEqual(resets, [True])
+
+    def test_insert_row(self) -> None:
+        model = RowTableModel(["URL"])
+        model.set_rows([["b"]])
+        model.insert_row(0, ["a"])
+        model.append_row(["c"])
+        model.insert_rows(1, [["x"], ["y"]])
+        self.assertEqual(model.rows(), [["a"], ["x"], ["y"], ["b"], ["c"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from mediaporter_app.throttle import qthrottled
+
+
+class ThrottleTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    @staticmethod
+    def _wait(ms: int) -> None:
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+
+    def test_burst_coalesces_into_one_trailing_call(self) -> None:
+        calls: list[tuple] = []
+        throttled = qthrottled(lambda *args: calls.append(args), 20)
+        throttled(1)
+        throttled(2)
+        throttled(3)
+        self.assertEqual(calls, [])
+        self._wait(60)
+        self.assertEqual(calls, [(3,)])
+
+    def test_flush_and_cancel(self) -> None:
+        calls: list[tuple] = []
+        throttled = qthrottled(lambda *args: calls.append(args), 1000)
+        throttled("a")
+        throttled.flush()
+        self.assertEqual(calls, [("a",)])
+
+        throttled("b")
+        throttled.cancel()
+        self._wait(20)
+        self.assertEqual(calls, [("a",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ from mediaporter_app.url_parser import (
     filter_supported_urls,
     is_supported_url,
     parse_download_entries,
+    parse_task_rows,
 )
 
 
@@ -17,6 +18,10 @@ class UrlParserTests(unittest.TestCase):
             ["https://www.bilibili.com/video/BV1xx", "https://example.com/a"],
         )
 
+    def test_extract_urls_without_scheme_separator(self) -> None:
+        self.assertEqual(extract_urls("watch http www.bilibili.com/video/BV1xx later"), [])
+        self.assertEqual(extract_urls("HTTPS://b23.tv/abc"), ["HTTPS://b23.tv/abc"])
+
     def test_filter_supported_urls_and_deduplicate(self) -> None:
         urls = [
             "https://www.bilibili.com/video/BV123",
@@ -38,6 +43,7 @@ class UrlParserTests(unittest.TestCase):
         self.assertTrue(is_supported_url("https://www.bilibili.com/bangumi/play/ss123"))
         self.assertTrue(is_supported_url("https://www.bilibili.com/movie/123"))
         self.assertFalse(is_supported_url("https://example.com/bangumi/play/ep1"))
+        self.assertTrue(is_supported_url("https://WWW.Bilibili.com:443/Video/BV1xx"))
 
     def test_filter_supported_url_with_trailing_punctuation(self) -> None:
         urls = ['"https://www.bilibili.com/video/BV18ofkBnE62/?a=1&b=2".']
@@ -72,6 +78,35 @@ class UrlParserTests(unittest.TestCase):
         self.assertEqual(tasks[0].filename, "song_a")
         self.assertEqual(tasks[1].filename, None)
 
+    def test_parse_task_rows_matches_line_parser(self) -> None:
+        rows = [
+            ("https://www.bilibili.com/video/BV1xx", " song_a "),
+            ("", "ignored"),
+            ("https\uff1a//b23.tv/abc\u3002", ""),
+            ("https://www.bilibili.com/video/BV1xx", "dup"),
+        ]
+        tasks, diagnostics = parse_task_rows(rows)
+        self.assertEqual(
+            [(task.url, task.filename) for task in tasks],
+            [("https://www.bilibili.com/video/BV1xx", "song_a"), ("https://b23.tv/abc", None)],
+        )
+        self.assertEqual(diagnostics, ["Line 4: duplicate ignored (https://www.bilibili.com/video/BV1xx)."])
+
+    def test_parse_task_rows_normalizes_like_joined_lines(self) -> None:
+        rows = [
+            ("https://www.bilibili.com/video/BV1xx", "part\uff1a1\uff1f"),
+            ("https://www.bilibili.com/video/BV2yy || from url cell", ""),
+            ("https://www.bilibili.com/video/BV3zz || left", "right"),
+        ]
+        joined = "\n".join(f"{url} || {name}" if name else url for url, name in rows)
+        tasks, _ = parse_task_rows(rows)
+        expected, _ = parse_download_entries(joined)
+        self.assertEqual(tasks, expected)
+        self.assertEqual(
+            [task.filename for task in tasks],
+            ["part:1?", "from url cell", "left || right"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,125 @@
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from mediaporter_app.models import DownloadResult, DownloadTask, ProgressUpdate, RetryPolicy
+from mediaporter_app.worker import DownloadWorker
+
+
+class _FakeDownloader:
+    threads: set[str] = set()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def __init__(self, **kwargs) -> None:
+        del kwargs
+
+    def download(self, url: str, progress_callback=None, filename: str | None = None) -> DownloadResult:
+        del progress_callback, filename
+        _FakeDownloader.threads.add(threading.current_thread().name)
+        _FakeDownloader.barrier.wait()
+        return DownloadResult(url=url, success=not url.endswith("bad"), message="done")
+
+    def close(self) -> None:
+        pass
+
+
+class _DrmDownloader:
+    calls = 0
+
+    def __init__(self, **kwargs) -> None:
+        del kwargs
+
+    def download(self, url: str, progress_callback=None, filename: str | None = None) -> DownloadResult:
+        del progress_callback, filename
+        _DrmDownloader.calls += 1
+        return DownloadResult(url=url, success=False, message="DRM", retriable=False)
+
+    def close(self) -> None:
+        pass
+
+
+class _CountingDownloader:
+    created = 0
+    closed = 0
+
+    def __init__(self, **kwargs) -> None:
+        del kwargs
+        _CountingDownloader.created += 1
+
+    def download(self, url: str, progress_callback=None, filename: str | None = None) -> DownloadResult:
+        del progress_callback, filename
+        return DownloadResult(url=url, success=True, message="done")
+
+    def close(self) -> None:
+        _CountingDownloader.closed += 1
+
+
+class DownloadWorkerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_tasks_run_in_parallel_and_report_totals(self) -> None:
+        tasks = [DownloadTask(url="https://b23.tv/ok"), DownloadTask(url="https://b23.tv/bad")]
+        worker = DownloadWorker(tasks=tasks, output_dir=Path("."), max_parallel=2)
+        totals: list[tuple[int, int]] = []
+        finished_indexes: list[int] = []
+        worker.all_done.connect(lambda success, failure: totals.append((success, failure)))
+        worker.task_finished.connect(lambda index, *_: finished_indexes.append(index))
+
+        loop = QEventLoop()
+        worker.finished.connect(loop.quit)
+        QTimer.singleShot(5000, loop.quit)
+        with mock.patch("mediaporter_app.worker.MediaDownloader", _FakeDownloader):
+            worker.run()
+            loop.exec()
+            worker.pool.waitForDone()
+
+        # Both fake downloads wait on a two-party barrier, so they must overlap.
+        self.assertEqual(len(_FakeDownloader.threads), 2)
+        self.assertEqual(totals, [(1, 1)])
+        self.assertEqual(sorted(finished_indexes), [0, 1])
+
+    def test_pool_thread_reuses_one_downloader(self) -> None:
+        tasks = [DownloadTask(url=f"https://b23.tv/{index}") for index in range(3)]
+        worker = DownloadWorker(tasks=tasks, output_dir=Path("."), max_parallel=1)
+        totals: list[tuple[int, int]] = []
+        worker.all_done.connect(lambda success, failure: totals.append((success, failure)))
+        with mock.patch("mediaporter_app.worker.MediaDownloader", _CountingDownloader):
+            worker.run()
+            worker.pool.waitForDone()
+        # all_done is emitted from the pool thread and queued to this one.
+        QCoreApplication.processEvents()
+        self.assertEqual(totals, [(3, 0)])
+        self.assertEqual((_CountingDownloader.created, _CountingDownloader.closed), (1, 1))
+
+    def test_non_retriable_failure_skips_remaining_attempts(self) -> None:
+        worker = DownloadWorker(tasks=[DownloadTask(url="https://b23.tv/drm")], output_dir=Path("."), max_retries=3)
+        retries: list[int] = []
+        worker.task_retry.connect(lambda _index, retry_no, *_: retries.append(retry_no))
+        with mock.patch("mediaporter_app.worker.MediaDownloader", _DrmDownloader):
+            worker.run()
+            worker.pool.waitForDone()
+        QCoreApplication.processEvents()
+        self.assertEqual((_DrmDownloader.calls, retries), (1, []))
+
+    def test_progress_is_rate_limited_per_task(self) -> None:
+        worker = DownloadWorker(tasks=[], output_dir=Path("."))
+        emitted: list[tuple[int, float]] = []
+        worker.task_progress.connect(lambda index, percent, _message: emitted.append((index, percent)))
+        for index, percent in ((0, 1.0), (0, 2.0), (1, 1.0), (0, 100.0)):
+            worker.on_progress(index, ProgressUpdate(percent=percent, message=""))
+        self.assertEqual(emitted, [(0, 1.0), (1, 1.0), (0, 100.0)])
+
+    def test_retry_policy_backs_off_exponentially_up_to_cap(self) -> None:
+        policy = RetryPolicy(base=1.0, cap=5.0, factor=2.0)
+        self.assertTrue(0.5 <= policy.delay_seconds(1) <= 1.5)
+        self.assertTrue(2.0 <= policy.delay_seconds(3) <= 6.0)
+        self.assertTrue(2.5 <= policy.delay_seconds(10) <= 7.5)
+
+
+if __name__ == "__main__":
+    unittest.main()